@@ -9,21 +9,118 @@ Requirements:
 - Graphviz installed on your system
 
 Usage:
-    python scripts/visualize_agents.py
+    python scripts/visualize_agents.py [--format {svg,png}]
+
+Graphs are written as SVG by default, which Graphviz renders faster than
+PNG and which scales cleanly in browsers.
+
+Graphs whose DOT source has not changed since the last run are not
+re-rendered; delete the matching `.fp` file in docs/ to force a render.
 """
 
+import argparse
+import hashlib
+import os
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+# Sample call details needed to build the voice agents (read-only)
+SAMPLE_RESERVATION_DETAILS = MappingProxyType(
+    {
+        "restaurant_name": "Demo Restaurant",
+        "restaurant_phone": "+1234567890",
+        "party_size": 4,
+        "date": "tomorrow",
+        "time": "7pm",
+        "customer_name": "Demo Customer",
+        "special_requests": "None",
+        "confirmation_number": "12345",
+    }
+)
+
+
+def _run_dot(dot_files: list[Path], fmt: str) -> None:
+    """Render a batch of DOT files with one `dot` process."""
+    subprocess.run(
+        ["dot", f"-T{fmt}", "-O", *(str(path) for path in dot_files)], check=True
+    )
+
+
+def render_graphs(output_paths: list[Path], fmt: str) -> bool:
+    """Render `<path>.dot` files to `<path>.<fmt>` with Graphviz.
+
+    The graphs are split into one batch per CPU core, and the batches are
+    rendered by parallel `dot` processes. The DOT sources are removed
+    afterwards, like draw_graph's cleanup.
+
+    Returns:
+        True if all graphs were rendered
+    """
+    if not output_paths:
+        return True
+
+    dot_files = [path.with_suffix(".dot") for path in output_paths]
+    workers = min(os.cpu_count() or 1, len(dot_files))
+    batches = [dot_files[i::workers] for i in range(workers)]
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results so a failing batch raises here
+            list(executor.map(_run_dot, batches, [fmt] * workers))
+        # `dot -O` names its output after the input file: foo.dot -> foo.dot.svg
+        for dot_file, output_path in zip(dot_files, output_paths, strict=True):
+            Path(f"{dot_file}.{fmt}").replace(f"{output_path}.{fmt}")
+            print(f"   ✓ Saved to: {output_path}.{fmt}")
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"   ⚠ Could not render graphs with Graphviz: {e}")
+        return False
+    else:
+        return True
+    finally:
+        for dot_file in dot_files:
+            dot_file.unlink(missing_ok=True)
+
+
+def graph_fingerprint(dot_source: str, fmt: str) -> str:
+    """Hash a graph's DOT source, which covers everything that is drawn."""
+    digest = hashlib.blake2b(dot_source.encode(), digest_size=16)
+    digest.update(fmt.encode())
+    return digest.hexdigest()
+
+
+def is_up_to_date(output_path: Path, fingerprint: str, fmt: str) -> bool:
+    """Check whether `<path>.<fmt>` was rendered from the same graph.
+
+    The fingerprint of the last render is stored next to the image in
+    `<path>.fp`.
+    """
+    fingerprint_file = output_path.with_suffix(".fp")
+    return (
+        Path(f"{output_path}.{fmt}").exists()
+        and fingerprint_file.exists()
+        and fingerprint_file.read_text() == fingerprint
+    )
+
 
-def main():
+def main(argv: list[str] | None = None):
     """Generate and display agent visualizations."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--format",
+        choices=("svg", "png"),
+        default="svg",
+        help="Output image format (default: svg)",
+    )
+    args = parser.parse_args(argv)
+
     try:
-        from agents.extensions.visualization import draw_graph
+        from agents.extensions.visualization import get_main_graph
     except ImportError:
         print("Error: openai-agents[viz] not installed.")
         print("Install with: pip install 'openai-agents[viz]'")
@@ -81,132 +178,90 @@ def main():
     orchestrator = orchestrator_instance.create()
 
     # Create transcript agent
-    transcript_agent_instance = TranscriptAnalysisAgent()
-    transcript_agent_instance.create()
+    transcript_agent = TranscriptAnalysisAgent().create()
 
+    # Imported only now: pulls in the realtime part of the Agents SDK
     from concierge.agents.voice_agent import VoiceAgent
 
-    # ... (rest of imports)
-
-    # Create voice agents (RealtimeAgent instances)
-    # These need sample data to create
-    sample_reservation_details = {
-        "restaurant_name": "Demo Restaurant",
-        "restaurant_phone": "+1234567890",
-        "party_size": 4,
-        "date": "tomorrow",
-        "time": "7pm",
-        "customer_name": "Demo Customer",
-        "special_requests": "None",
-        "confirmation_number": "12345",
-    }
-
+    # Create voice agents (RealtimeAgent instances). VoiceAgent adds the
+    # current date to its context, so each gets its own copy of the sample.
     reservation_voice_agent_instance = VoiceAgent(
-        "reservation_voice_agent", sample_reservation_details
+        "reservation_voice_agent", dict(SAMPLE_RESERVATION_DETAILS)
     )
     reservation_voice_agent = reservation_voice_agent_instance.create()
 
     cancellation_voice_agent_instance = VoiceAgent(
-        "cancellation_voice_agent", sample_reservation_details
+        "cancellation_voice_agent", dict(SAMPLE_RESERVATION_DETAILS)
     )
     cancellation_voice_agent = cancellation_voice_agent_instance.create()
 
+    docs_dir = project_root / "docs"
+    docs_dir.mkdir(exist_ok=True)
+    graphs = [
+        ("1", "Orchestrator agent", orchestrator, "orchestrator"),
+        ("1b", "Reservation agent", reservation_agent, "reservation"),
+        ("1c", "Cancellation agent", cancellation_agent, "cancellation"),
+        ("1d", "Search agent", search_agent, "search"),
+        ("2", "Transcript agent", transcript_agent, "transcript"),
+        ("3", "Reservation voice agent", reservation_voice_agent, "reservation_voice"),
+        (
+            "4",
+            "Cancellation voice agent",
+            cancellation_voice_agent,
+            "cancellation_voice",
+        ),
+    ]
+
     print("Generating visualizations...")
 
-    # Graph 1: Main Architecture (Orchestrator)
-    print("\n1. Generating main architecture graph (Orchestrator)...")
-    orchestrator_output_path = (
-        project_root / "docs" / "orchestrator_agent_visualization"
-    )
-    try:
-        draw_graph(orchestrator, filename=str(orchestrator_output_path))
-        print(f"   ✓ Saved to: {orchestrator_output_path}.png")
-    except Exception as e:
-        print(f"   ⚠ Could not visualize orchestrator agent: {e}")
-
-    # Graph 1b: Reservation Agent
-    print("\n1b. Generating reservation agent graph...")
-    reservation_output_path = project_root / "docs" / "reservation_agent_visualization"
-    try:
-        draw_graph(reservation_agent, filename=str(reservation_output_path))
-        print(f"   ✓ Saved to: {reservation_output_path}.png")
-    except Exception as e:
-        print(f"   ⚠ Could not visualize reservation agent: {e}")
-
-    # Graph 1c: Cancellation Agent
-    print("\n1c. Generating cancellation agent graph...")
-    cancellation_output_path = (
-        project_root / "docs" / "cancellation_agent_visualization"
-    )
-    try:
-        draw_graph(cancellation_agent, filename=str(cancellation_output_path))
-        print(f"   ✓ Saved to: {cancellation_output_path}.png")
-    except Exception as e:
-        print(f"   ⚠ Could not visualize cancellation agent: {e}")
-
-    # Graph 1d: Search Agent
-    print("\n1d. Generating search agent graph...")
-    search_output_path = project_root / "docs" / "search_agent_visualization"
-    try:
-        draw_graph(search_agent, filename=str(search_output_path))
-        print(f"   ✓ Saved to: {search_output_path}.png")
-    except Exception as e:
-        print(f"   ⚠ Could not visualize search agent: {e}")
-
-    # Graph 2: Transcript Analysis Agent
-    print("\n2. Generating transcript agent graph...")
-    transcript_output_path = project_root / "docs" / "transcript_agent_visualization"
-    try:
-        draw_graph(transcript_agent_instance, filename=str(transcript_output_path))
-        print(f"   ✓ Saved to: {transcript_output_path}.png")
-    except Exception as e:
-        print(f"   ⚠ Could not visualize transcript agent: {e}")
-
-    # Graph 3: Reservation Voice Agent (RealtimeAgent)
-    print("\n3. Generating reservation voice agent graph...")
-    reservation_voice_output_path = (
-        project_root / "docs" / "reservation_voice_agent_visualization"
-    )
-    try:
-        draw_graph(reservation_voice_agent, filename=str(reservation_voice_output_path))
-        print(f"   ✓ Saved to: {reservation_voice_output_path}.png")
-    except Exception as e:
-        print(f"   ⚠ Could not visualize reservation voice agent: {e}")
-        print("      (RealtimeAgent may not be compatible with draw_graph)")
-
-    # Graph 4: Cancellation Voice Agent (RealtimeAgent)
-    print("\n4. Generating cancellation voice agent graph...")
-    cancellation_voice_output_path = (
-        project_root / "docs" / "cancellation_voice_agent_visualization"
+    # Write the DOT source of every changed graph first, then render them all
+    # with batched Graphviz processes instead of one `dot` run per graph
+    rendered = []
+    pending = []
+    for number, title, agent, slug in graphs:
+        print(f"\n{number}. Generating {title.lower()} graph...")
+        output_path = docs_dir / f"{slug}_agent_visualization"
+        try:
+            dot_source = get_main_graph(agent)
+        except Exception as e:
+            print(f"   ⚠ Could not visualize {title.lower()}: {e}")
+            continue
+
+        fingerprint = graph_fingerprint(dot_source, args.format)
+        if is_up_to_date(output_path, fingerprint, args.format):
+            print(f"   ↻ Unchanged: {output_path}.{args.format}")
+        else:
+            output_path.with_suffix(".dot").write_text(dot_source)
+            pending.append((output_path, fingerprint))
+        rendered.append((number, title, output_path))
+
+    if render_graphs([output_path for output_path, _ in pending], args.format):
+        for output_path, fingerprint in pending:
+            output_path.with_suffix(".fp").write_text(fingerprint)
+    else:
+        rendered = []
+
+    # Build the whole summary and write it in one go
+    summary = [
+        "",
+        "=" * 70,
+        "Visualization Summary",
+        "=" * 70,
+        "",
+        "The visualizations show:",
+        "  - Yellow boxes: Agents",
+        "  - Green ellipses: Tools",
+        "  - Arrows: Handoffs between agents",
+        "  - __start__ node: Entry point",
+        "  - __end__ node: Exit point",
+        "",
+        "Generated graphs:",
+    ]
+    summary.extend(
+        f"  {number}. {title}: {output_path}.{args.format}"
+        for number, title, output_path in rendered
     )
-    try:
-        draw_graph(
-            cancellation_voice_agent, filename=str(cancellation_voice_output_path)
-        )
-        print(f"   ✓ Saved to: {cancellation_voice_output_path}.png")
-    except Exception as e:
-        print(f"   ⚠ Could not visualize cancellation voice agent: {e}")
-        print("      (RealtimeAgent may not be compatible with draw_graph)")
-
-    print("\n" + "=" * 70)
-    print("Visualization Summary")
-    print("=" * 70)
-    print("\nThe visualizations show:")
-    print("  - Yellow boxes: Agents")
-    print("  - Green ellipses: Tools")
-    print("  - Arrows: Handoffs between agents")
-    print("  - __start__ node: Entry point")
-    print("  - __end__ node: Exit point")
-    print("\nGenerated graphs:")
-
-    # Summary of generated graphs
-    print(f"  1. Orchestrator agent: {orchestrator_output_path}.png")
-    print(f"  1b. Reservation agent: {reservation_output_path}.png")
-    print(f"  1c. Cancellation agent: {cancellation_output_path}.png")
-    print(f"  1d. Search agent: {search_output_path}.png")
-    print(f"  2. Transcript agent: {transcript_output_path}.png")
-    print(f"  3. Reservation voice agent: {reservation_voice_output_path}.png")
-    print(f"  4. Cancellation voice agent: {cancellation_voice_output_path}.png")
+    print("\n".join(summary))
 
 
 if __name__ == "__main__":
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The orchestrator prompt takes no parameters, so it is rendered once at import
+_INSTRUCTIONS = load_prompt("orchestrator_agent")
+
 
 class OrchestratorAgent:
     """Orchestrator agent that routes requests to specialized agents.
@@ -21,7 +24,7 @@ class OrchestratorAgent:
     and routes to the appropriate specialized agent.
 
     Attributes:
-        specialized_agents: List of specialized agents to route to
+        specialized_agents: Specialized agents to route to
         config: Application configuration
         _agent: The underlying Agent instance (created lazily)
     """
@@ -43,12 +46,12 @@ class OrchestratorAgent:
             input_guardrails: List of input guardrails to apply (optional)
             output_guardrails: List of output guardrails to apply (optional)
         """
-        # Build list of specialized agents
-        self.specialized_agents: list[Agent] = [
+        # Specialized agents are fixed for the lifetime of the orchestrator
+        self.specialized_agents: tuple[Agent, ...] = (
             reservation_agent,
             cancellation_agent,
             search_agent,
-        ]
+        )
 
         self.config = get_config()
         self.input_guardrails = input_guardrails or []
@@ -70,20 +73,19 @@ class OrchestratorAgent:
             The agent is created lazily on first call and cached.
         """
         if self._agent is None:
-            # Load instructions from template
-            instructions = load_prompt("orchestrator_agent")
-
             self._agent = Agent(
                 name="AI Concierge Orchestrator",
                 model=self.config.agent_model,
-                instructions=instructions,
-                handoffs=self.specialized_agents,
+                instructions=_INSTRUCTIONS,
+                handoffs=list(self.specialized_agents),
                 input_guardrails=self.input_guardrails,
                 output_guardrails=self.output_guardrails,
             )
             logger.info("Orchestrator agent created successfully")
             logger.info(
-                f"  with {len(self.input_guardrails)} input guardrails and {len(self.output_guardrails)} output guardrails"
+                "  with %d input guardrails and %d output guardrails",
+                len(self.input_guardrails),
+                len(self.output_guardrails),
             )
 
         return self._agent
@@ -1,11 +1,30 @@
 """Prompt template management for AI Concierge agents."""
 
+from functools import lru_cache
 from pathlib import Path
 
 
 PROMPT_DIR = Path(__file__).parent
 
 
+@lru_cache(maxsize=32)
+def _read_template(name: str) -> str:
+    """Read a prompt template from disk, once per name.
+
+    Args:
+        name: Name of the prompt file (without .md extension)
+
+    Returns:
+        Raw, unformatted template text
+    """
+    prompt_file = PROMPT_DIR / f"{name}.md"
+
+    if not prompt_file.exists():
+        raise FileNotFoundError(f"Prompt template not found: {prompt_file}")
+
+    return prompt_file.read_text()
+
+
 def load_prompt(name: str, **kwargs) -> str:
     """Load and format a prompt template.
 
@@ -23,12 +42,7 @@ def load_prompt(name: str, **kwargs) -> str:
         ...     date="tomorrow",
         ...     time="7pm")
     """
-    prompt_file = PROMPT_DIR / f"{name}.md"
-
-    if not prompt_file.exists():
-        raise FileNotFoundError(f"Prompt template not found: {prompt_file}")
-
-    template = prompt_file.read_text()
+    template = _read_template(name)
 
     # Format the template with provided kwargs
     # Use safe_substitute to handle missing variables gracefully
@@ -7,7 +7,7 @@ from agents import function_tool
 from openai import OpenAI
 
 from concierge.config import get_config
-from concierge.services.restaurant_service import RestaurantService
+from concierge.services.restaurant_service import get_restaurant_service
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +24,7 @@ def find_restaurant(restaurant_name: str) -> dict:
     """
     logger.info(f"Looking up restaurant: {restaurant_name}")
 
-    service = RestaurantService()
-    restaurant = service.find_restaurant(restaurant_name)
+    restaurant = get_restaurant_service().find_restaurant(restaurant_name)
 
     if not restaurant:
         return {
@@ -3,13 +3,12 @@
 import asyncio
 import logging
 import contextlib
-from datetime import datetime
-import uuid
+import time
 
 from concierge.config import get_config
 from concierge.models import Restaurant, VoiceCallResult
-from concierge.services.call_manager import get_call_manager
-from concierge.services.twilio_service import TwilioService
+from concierge.services.call_manager import CallManager, get_call_manager
+from concierge.services.twilio_service import get_twilio_service
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +31,10 @@ async def _make_voice_call(
         VoiceCallResult with the outcome of the call
     """
     restaurant_name = call_details.get("restaurant_name", "Unknown")
-    logger.info(f"Initiating real-time {call_type} call to {restaurant_name}")
+    logger.info("Initiating real-time %s call to %s", call_type, restaurant_name)
 
     config = get_config()
-    twilio_service = TwilioService()
+    twilio_service = get_twilio_service()
     call_manager = get_call_manager()
 
     # Check if Twilio is configured
@@ -63,7 +62,7 @@ async def _make_voice_call(
             call_id=None,
         )
 
-    start_time = datetime.now()
+    start_time = time.monotonic()
     call_id = None
 
     try:
@@ -75,30 +74,40 @@ async def _make_voice_call(
         call_id = call_details.get("call_id") or call_manager.generate_call_id()
 
         call_manager.create_call(call_details, call_id)
-        logger.info(f"✓ Created call {call_id} in CallManager (call_type: {call_type})")
+        logger.info(
+            "✓ Created call %s in CallManager (call_type: %s)", call_id, call_type
+        )
 
         # Step 2: Build TwiML URL
         twiml_url = f"https://{config.public_domain}/twiml?call_id={call_id}"
-        status_callback_url = f"https://{config.public_domain}/twilio-status"
-        logger.info(f"TwiML URL: {twiml_url}")
+        status_callback_url = (
+            f"https://{config.public_domain}/twilio-status?call_id={call_id}"
+        )
+        logger.info("TwiML URL: %s", twiml_url)
 
-        # Step 3: Initiate Twilio call
-        call_sid = twilio_service.initiate_call(
+        # Step 3: Initiate Twilio call. The Twilio client is synchronous, so the
+        # REST request runs in a worker thread to keep active media streams
+        # on the event loop responsive.
+        call_sid = await asyncio.to_thread(
+            twilio_service.initiate_call,
             to_number=to_number,
             twiml_url=twiml_url,
             status_callback=status_callback_url,
         )
-        logger.info(f"Initiated Twilio call {call_sid} for {call_type} call {call_id}")
+        logger.info(
+            "Initiated Twilio call %s for %s call %s", call_sid, call_type, call_id
+        )
+        call_manager.set_call_sid(call_id, call_sid)
 
         # Step 4: Wait for call to complete
         result = await wait_for_call_completion(call_id, timeout=timeout)
 
-        duration = (datetime.now() - start_time).total_seconds()
-        result.call_duration = duration
+        duration = time.monotonic() - start_time
+        result = result.model_copy(update={"call_duration": duration})
 
     except Exception as e:
-        logger.exception(f"Error making realtime {call_type} call")
-        duration = (datetime.now() - start_time).total_seconds()
+        logger.exception("Error making realtime %s call", call_type)
+        duration = time.monotonic() - start_time
 
         # Try to get call_id if it was created before the error
         error_call_id = None
@@ -144,9 +153,9 @@ async def make_cancellation_call_via_twilio(cancellation_details: dict) -> dict:
     Returns:
         Dictionary with cancellation result
     """
-    # Generate a UUID for cancellation calls if not present (to match previous behavior)
+    # Generate a call ID for cancellation calls if not present (to match previous behavior)
     if "call_id" not in cancellation_details:
-        cancellation_details["call_id"] = str(uuid.uuid4())
+        cancellation_details["call_id"] = CallManager.generate_call_id()
 
     restaurant_phone = cancellation_details.get("restaurant_phone")
 
@@ -171,12 +180,12 @@ async def make_cancellation_call_via_twilio(cancellation_details: dict) -> dict:
     restaurant_name = cancellation_details.get("restaurant_name")
     confirmation_number = cancellation_details.get("confirmation_number")
     date = cancellation_details.get("date", "")
-    time = cancellation_details.get("time", "")
+    cancel_time = cancellation_details.get("time", "")
     party_size = cancellation_details.get("party_size", "")
 
     confirmation_msg = (
         f"Your reservation at {restaurant_name} for {party_size} people "
-        f"on {date} at {time} has been successfully cancelled. "
+        f"on {date} at {cancel_time} has been successfully cancelled. "
         f"Original confirmation number: {confirmation_number}."
     )
 
@@ -192,119 +201,99 @@ async def make_cancellation_call_via_twilio(cancellation_details: dict) -> dict:
         "restaurant_name": restaurant_name,
         "original_confirmation": confirmation_number,
         "date": date,
-        "time": time,
+        "time": cancel_time,
         "party_size": party_size,
     }
 
 
-async def wait_for_call_completion(
-    call_id: str, timeout: int = 180, poll_interval: int = 2
-) -> VoiceCallResult:
-    """Wait for a call to complete by polling CallManager.
+async def wait_for_call_completion(call_id: str, timeout: int = 180) -> VoiceCallResult:
+    """Wait for a call to complete.
+
+    Waits on the call's completion event and, for completed calls, on the
+    transcript analysis event, so the result is returned as soon as it exists.
 
     Args:
         call_id: Call identifier
         timeout: Maximum wait time in seconds
-        poll_interval: Seconds between status checks
 
     Returns:
         VoiceCallResult
 
     Raises:
-        TimeoutError: If call doesn't complete within timeout
+        ValueError: If the call is not registered in CallManager
     """
     call_manager = get_call_manager()
-    elapsed = 0
-
-    logger.info(f"Waiting for call {call_id} to complete (timeout: {timeout}s)")
-
-    while elapsed < timeout:
-        await asyncio.sleep(poll_interval)
-        elapsed += poll_interval
-
-        call_state = call_manager.get_call(call_id)
-        if not call_state:
-            msg = f"Call {call_id} not found in CallManager"
-            raise ValueError(msg)
-
-        if call_state.status == "completed":
-            logger.info(f"Call {call_id} completed successfully")
-
-            # Wait a bit for LLM transcript analysis to complete
-            # The analysis runs async in update_status(), so we need to give it time
-            max_analysis_wait = 10  # seconds
-            analysis_elapsed = 0
-
-            while analysis_elapsed < max_analysis_wait:
-                # Check if transcript analysis has completed by looking for the confirmed_time field
-                # which is only set by the LLM analysis
-                if "confirmed_time" in call_state.reservation_details:
-                    logger.info(
-                        "✓ Transcript analysis completed, proceeding with result"
-                    )
-                    break
-
-                # Also break if we have a confirmation number (analysis might be done)
-                if call_state.confirmation_number:
-                    logger.info("✓ Confirmation number present, proceeding with result")
-                    break
-
-                await asyncio.sleep(0.5)  # Check every 500ms
-                analysis_elapsed += 0.5
-
-                # Refresh call state
-                call_state = call_manager.get_call(call_id)
-
-            if analysis_elapsed >= max_analysis_wait:
-                logger.warning(
-                    f"⚠ Transcript analysis did not complete within {max_analysis_wait}s, proceeding anyway"
-                )
-
-            # Determine status based on confirmation number
-            if call_state.confirmation_number:
-                status = "confirmed"
-                message = f"Reservation confirmed at {call_state.reservation_details.get('restaurant_name', 'restaurant')}"
-            else:
-                status = "pending"
-                message = "Call completed but no confirmation number received. Please check with restaurant."
-
-            # Extract confirmed time and date from transcript analysis
-            confirmed_time = call_state.reservation_details.get("confirmed_time")
-            confirmed_date = call_state.reservation_details.get("confirmed_date")
-
-            return VoiceCallResult(
-                status=status,
-                restaurant_name=call_state.reservation_details.get(
-                    "restaurant_name", "Unknown"
-                ),
-                confirmation_number=call_state.confirmation_number,
-                confirmed_time=confirmed_time,
-                confirmed_date=confirmed_date,
-                message=message,
-                call_id=call_id,
-            )
+    call_state = call_manager.get_call(call_id)
+    if not call_state:
+        msg = f"Call {call_id} not found in CallManager"
+        raise ValueError(msg)
+
+    logger.info("Waiting for call %s to complete (timeout: %ss)", call_id, timeout)
 
-        if call_state.status == "failed":
-            logger.error(f"Call {call_id} failed: {call_state.error_message}")
-            return VoiceCallResult(
-                status="error",
-                restaurant_name=call_state.reservation_details.get(
-                    "restaurant_name", "Unknown"
-                ),
-                message=f"Call failed: {call_state.error_message}",
-                call_id=call_id,
+    try:
+        await asyncio.wait_for(call_state.completion_event.wait(), timeout=timeout)
+    except TimeoutError:
+        logger.warning("Call %s timed out after %ss", call_id, timeout)
+        await call_manager.update_status(call_id, "failed")
+        call_manager.set_error(call_id, f"Call timed out after {timeout}s")
+
+        return VoiceCallResult(
+            status="error",
+            restaurant_name=call_state.reservation_details.get(
+                "restaurant_name", "Unknown"
+            ),
+            message=f"Call timed out after {timeout} seconds",
+            call_id=call_id,
+        )
+
+    if call_state.status == "completed":
+        logger.info("Call %s completed successfully", call_id)
+
+        # The transcript analysis runs in the background once the call is
+        # marked completed, so give it time to fill in the details
+        max_analysis_wait = 10  # seconds
+        try:
+            await asyncio.wait_for(
+                call_state.analysis_event.wait(), timeout=max_analysis_wait
+            )
+            logger.info("✓ Transcript analysis completed, proceeding with result")
+        except TimeoutError:
+            logger.warning(
+                "⚠ Transcript analysis did not complete within %ss, proceeding anyway",
+                max_analysis_wait,
             )
 
-    # Timeout
-    logger.warning(f"Call {call_id} timed out after {timeout}s")
-    await call_manager.update_status(call_id, "failed")
-    call_manager.set_error(call_id, f"Call timed out after {timeout}s")
+        # Determine status based on confirmation number
+        if call_state.confirmation_number:
+            status = "confirmed"
+            message = f"Reservation confirmed at {call_state.reservation_details.get('restaurant_name', 'restaurant')}"
+        else:
+            status = "pending"
+            message = "Call completed but no confirmation number received. Please check with restaurant."
+
+        # Extract confirmed time and date from transcript analysis
+        confirmed_time = call_state.reservation_details.get("confirmed_time")
+        confirmed_date = call_state.reservation_details.get("confirmed_date")
+
+        return VoiceCallResult(
+            status=status,
+            restaurant_name=call_state.reservation_details.get(
+                "restaurant_name", "Unknown"
+            ),
+            confirmation_number=call_state.confirmation_number,
+            confirmed_time=confirmed_time,
+            confirmed_date=confirmed_date,
+            message=message,
+            call_id=call_id,
+        )
 
+    # The completion event is only set for completed and failed calls
+    logger.error("Call %s failed: %s", call_id, call_state.error_message)
     return VoiceCallResult(
         status="error",
-        restaurant_name=call_manager.get_call(call_id).reservation_details.get(
+        restaurant_name=call_state.reservation_details.get(
             "restaurant_name", "Unknown"
         ),
-        message=f"Call timed out after {timeout} seconds",
+        message=f"Call failed: {call_state.error_message}",
         call_id=call_id,
     )
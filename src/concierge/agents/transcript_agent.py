@@ -1,6 +1,7 @@
 """Agent for analyzing call transcripts and extracting confirmed reservation details."""
 
 import logging
+from collections.abc import Iterable
 from agents import Agent, Runner
 from concierge.config import get_config
 from concierge.models import ConfirmedReservationDetails
@@ -39,12 +40,12 @@ class TranscriptAnalysisAgent:
         return self._agent
 
     async def analyze_transcript(
-        self, transcript_lines: list[str], original_details: dict
+        self, transcript_lines: Iterable[str], original_details: dict
     ) -> ConfirmedReservationDetails:
         """Analyze a transcript and extract confirmed details.
 
         Args:
-            transcript_lines: List of transcript lines from the call
+            transcript_lines: Transcript lines from the call
             original_details: The originally requested reservation details
 
         Returns:
@@ -83,8 +84,7 @@ Do NOT interpret or guess - if no valid confirmation number is found, return Non
 
         logger.info("Analyzing transcript with LLM...")
 
-        runner = Runner()
-        result = await runner.run(starting_agent=self._agent, input=analysis_prompt)
+        result = await Runner.run(starting_agent=self._agent, input=analysis_prompt)
 
         # The output should be a ConfirmedReservationDetails object
         confirmed_details = result.final_output
@@ -1,7 +1,8 @@
 """Generic voice agent for making real-time calls using OpenAI Realtime API."""
 
 import logging
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from typing import Any
 
 from agents.realtime import RealtimeAgent
@@ -11,6 +12,19 @@ from concierge.agents.prompts import load_prompt
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _format_date(day: date) -> str:
+    """Format a date for the prompt, once per day.
+
+    Args:
+        day: Date to format
+
+    Returns:
+        Date such as "Monday, January 01, 2025"
+    """
+    return day.strftime("%A, %B %d, %Y")
+
+
 class VoiceAgent:
     """Generic voice agent for making real-time calls.
 
@@ -34,11 +48,12 @@ class VoiceAgent:
         self.context = context
         self._agent: RealtimeAgent | None = None
 
-        logger.info(
-            "VoiceAgent initialized with template '%s' for %s",
-            template_name,
-            context.get("restaurant_name", "unknown restaurant"),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "VoiceAgent initialized with template '%s' for %s",
+                template_name,
+                context.get("restaurant_name", "unknown restaurant"),
+            )
 
     def create(self) -> RealtimeAgent:
         """Create and return the configured RealtimeAgent.
@@ -49,7 +64,7 @@ class VoiceAgent:
         if self._agent is None:
             # Add current date to context if not present
             if "current_date" not in self.context:
-                self.context["current_date"] = datetime.now().strftime("%A, %B %d, %Y")
+                self.context["current_date"] = _format_date(date.today())
 
             # Load and format prompt from template
             instructions = load_prompt(self.template_name, **self.context)
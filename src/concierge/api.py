@@ -1,11 +1,13 @@
 """FastAPI server for handling Twilio Media Streams and OpenAI Realtime API and agent orchestration."""
 
+import json
 import logging
 import os
+import sys
 from contextlib import asynccontextmanager, suppress
+from xml.sax.saxutils import quoteattr
 from concierge.config import setup_logging
 import uuid
-import uvicorn
 from agents import Agent, Runner, SQLiteSession, InputGuardrailTripwireTriggered
 from fastapi import (
     FastAPI,
@@ -16,7 +18,7 @@ from fastapi import (
     Request,
     Depends,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from concierge.agents import (
@@ -33,7 +35,9 @@ from concierge.agents.tools import (
     lookup_reservation_from_history,
     search_restaurants_llm,
 )
-from concierge.config import get_config
+from concierge.config import Config, get_config
+from concierge.models import HealthResponse, ProcessRequestResponse
+from concierge.services.call_manager import get_call_manager
 from concierge.agents.guardrails import (
     input_validation_guardrail,
     output_validation_guardrail,
@@ -42,15 +46,34 @@ from concierge.agents.guardrails import (
 
 logger = logging.getLogger(__name__)
 
+# TwiML with Stream parameters:
+# - track="inbound_track" is the only valid value for <Connect> verb
+# - Custom parameters are sent in the 'start' event to the WebSocket
+# Attribute values are filled in already quoted via xml.sax.saxutils.quoteattr.
+_TWIML_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say>Connecting you to our reservation system.</Say>
+    <Connect>
+        <Stream url={url} track="inbound_track">
+            <Parameter name="call_id" value={call_id} />
+        </Stream>
+    </Connect>
+</Response>"""
+
+# Final Twilio call statuses for calls that never reached the media stream
+_UNANSWERED_CALL_STATUSES = frozenset({"busy", "no-answer", "failed", "canceled"})
+
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     """Application lifespan manager."""
     config = get_config()
     logger.info(
-        f"Starting AI Concierge Voice Server on {config.server_host}:{config.server_port}"
+        "Starting AI Concierge Voice Server on %s:%s",
+        config.server_host,
+        config.server_port,
     )
-    logger.info(f"Public domain: {config.public_domain or 'NOT CONFIGURED'}")
+    logger.info("Public domain: %s", config.public_domain or "NOT CONFIGURED")
 
     # Ensure OpenAI API key is available to the SDK via environment variable
     if config.openai_api_key and "OPENAI_API_KEY" not in os.environ:
@@ -143,13 +166,61 @@ def get_orchestrator_agent(request: Request) -> Agent:
     return agent
 
 
-@app.get("/health")
+def _record_guardrail_block(
+    session: SQLiteSession,
+    user_input: str,
+    error: InputGuardrailTripwireTriggered,
+) -> str:
+    """Complete the conversation turn for a request blocked by a guardrail.
+
+    Args:
+        session: Conversation session of the request
+        user_input: The blocked user input
+        error: The guardrail tripwire exception
+
+    Returns:
+        Message explaining why the request was blocked
+    """
+    # Guardrail blocked the request - extract the message
+    logger.warning("⚠️ Request blocked by guardrail")
+    guardrail_message = (
+        str(error.guardrail_result.output.output_info)
+        if hasattr(error, "guardrail_result")
+        else "Request blocked by guardrail"
+    )
+
+    # Add conversation turn to session so it continues properly
+    # This follows the pattern from the official SDK example:
+    # When a guardrail triggers, we need to complete the turn manually
+    try:
+        # Add the user message (if not already in session)
+        session.add_message({"role": "user", "content": user_input})
+        # Add assistant refusal message
+        session.add_message(
+            {
+                "role": "assistant",
+                "content": f"I cannot process this request. {guardrail_message}",
+            }
+        )
+    except Exception as session_error:
+        # If session update fails (e.g., duplicate), just log and continue
+        logger.debug("Session update after guardrail: %s", session_error)
+
+    return guardrail_message
+
+
+def _sse(payload: dict) -> str:
+    """Format a payload as a Server-Sent Events data line."""
+    return f"data: {json.dumps(payload, default=str)}\n\n"
+
+
+@app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint for monitoring."""
-    return {"status": "healthy", "service": "ai-concierge-api"}
+    return HealthResponse(status="healthy", service="ai-concierge-api")
 
 
-@app.post("/process-request")
+@app.post("/process-request", response_model=ProcessRequestResponse)
 async def process_request(
     request: Request,
     orchestrator_agent: Agent = Depends(get_orchestrator_agent),
@@ -188,48 +259,23 @@ async def process_request(
         # Generate session_id if not provided (for conversation memory)
         if not session_id:
             session_id = f"session-{uuid.uuid4().hex[:12]}"
-            logger.debug(f"Generated session: {session_id}")
+            logger.debug("Generated session: %s", session_id)
         else:
-            logger.debug(f"Using session: {session_id}")
+            logger.debug("Using session: %s", session_id)
 
         # Create session for conversation memory (SDK feature)
         session = SQLiteSession(session_id, "conversations.db")
 
-        logger.info(f"Processing: {user_input[:80]}...")
+        logger.info("Processing: %.80s...", user_input)
 
         # Run the orchestrator using the SDK Runner (async version)
         # Pass session to enable conversation memory across turns
-        runner = Runner()
-
         try:
-            result = await runner.run(
+            result = await Runner.run(
                 starting_agent=orchestrator_agent, input=user_input, session=session
             )
         except InputGuardrailTripwireTriggered as e:
-            # Guardrail blocked the request - extract the message
-            logger.warning("⚠️ Request blocked by guardrail")
-            guardrail_message = (
-                str(e.guardrail_result.output.output_info)
-                if hasattr(e, "guardrail_result")
-                else "Request blocked by guardrail"
-            )
-
-            # Add conversation turn to session so it continues properly
-            # This follows the pattern from the official SDK example:
-            # When a guardrail triggers, we need to complete the turn manually
-            try:
-                # Add the user message (if not already in session)
-                session.add_message({"role": "user", "content": user_input})
-                # Add assistant refusal message
-                session.add_message(
-                    {
-                        "role": "assistant",
-                        "content": f"I cannot process this request. {guardrail_message}",
-                    }
-                )
-            except Exception as session_error:
-                # If session update fails (e.g., duplicate), just log and continue
-                logger.debug(f"Session update after guardrail: {session_error}")
+            guardrail_message = _record_guardrail_block(session, user_input, e)
 
             return JSONResponse(
                 status_code=400,
@@ -253,13 +299,13 @@ async def process_request(
 
         logger.info("Request processed successfully")
 
-        return {
-            "success": True,
-            "message": "Request processed successfully",
-            "final_output": final_output,
-            "formatted_result": formatted_result,
-            "session_id": session_id,  # Return session_id for client to reuse
-        }
+        return ProcessRequestResponse(
+            success=True,
+            message="Request processed successfully",
+            final_output=final_output,
+            formatted_result=formatted_result,
+            session_id=session_id,  # Return session_id for client to reuse
+        )
 
     except Exception as e:
         logger.exception("Error processing request")
@@ -273,19 +319,111 @@ async def process_request(
         )
 
 
+@app.post("/process-request/stream")
+async def process_request_stream(
+    request: Request,
+    orchestrator_agent: Agent = Depends(get_orchestrator_agent),
+):
+    """Process a request and stream the agent output as Server-Sent Events.
+
+    Accepts the same body as ``/process-request``. Text is streamed as it is
+    generated, so clients can show the first words before the run finishes.
+
+    Events:
+        {"type": "delta", "text": "..."}
+        {"type": "result", ...}  # Same fields as the /process-request response
+        {"type": "error", ...}   # Same fields as the /process-request errors
+    """
+    try:
+        data = await request.json()
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        return JSONResponse(
+            status_code=400,
+            content={"error": "Request body must be a JSON object"},
+        )
+
+    user_input = data.get("user_input")
+    session_id = data.get("session_id")
+
+    if not user_input:
+        return JSONResponse(
+            status_code=400,
+            content={"error": "Missing user_input field"},
+        )
+
+    if not session_id:
+        session_id = f"session-{uuid.uuid4().hex[:12]}"
+
+    session = SQLiteSession(session_id, "conversations.db")
+
+    async def event_stream():
+        try:
+            result = Runner.run_streamed(
+                starting_agent=orchestrator_agent, input=user_input, session=session
+            )
+            async for event in result.stream_events():
+                if (
+                    event.type == "raw_response_event"
+                    and event.data.type == "response.output_text.delta"
+                ):
+                    yield _sse({"type": "delta", "text": event.data.delta})
+
+            result_event = _sse(
+                {
+                    "type": "result",
+                    "success": True,
+                    "message": "Request processed successfully",
+                    "final_output": result.final_output,
+                    "formatted_result": format_reservation_result(result),
+                    "session_id": session_id,
+                }
+            )
+        except InputGuardrailTripwireTriggered as e:
+            guardrail_message = _record_guardrail_block(session, user_input, e)
+            yield _sse(
+                {
+                    "type": "error",
+                    "success": False,
+                    "error": "Request blocked by guardrail",
+                    "message": guardrail_message,
+                    "session_id": session_id,
+                }
+            )
+            return
+        except Exception as e:
+            logger.exception("Error processing streamed request")
+            yield _sse(
+                {
+                    "type": "error",
+                    "success": False,
+                    "error": str(e),
+                    "message": f"Error processing request: {e}",
+                }
+            )
+            return
+
+        yield result_event
+
+    logger.info("Streaming: %.80s...", user_input)
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.post("/twiml")
-async def generate_twiml(call_id: str = Query(..., description="Unique call ID")):
+async def generate_twiml(
+    call_id: str = Query(..., description="Unique call ID"),
+    config: Config = Depends(get_config),
+):
     """Generate TwiML to route Twilio call to Media Stream WebSocket.
 
     Args:
         call_id: Unique identifier for this call
-        test_mode: If True, return simple test TwiML without WebSocket
+        config: Application configuration (injected)
 
     Returns:
         TwiML XML response
     """
-    config = get_config()
-
     if not config.public_domain:
         logger.error("PUBLIC_DOMAIN not configured - cannot generate TwiML")
         return Response(
@@ -294,34 +432,27 @@ async def generate_twiml(call_id: str = Query(..., description="Unique call ID")
             status_code=500,
         )
 
-    # Build parameter string for TwiML
-    # Only pass call_id - everything else is retrieved from CallManager
-
-    # Use wss:// for secure WebSocket connection
+    # Use wss:// for secure WebSocket connection. Only call_id is passed -
+    # everything else is retrieved from CallManager.
     websocket_url = f"wss://{config.public_domain}/media-stream"
+    twiml = _TWIML_TEMPLATE.format(
+        url=quoteattr(websocket_url), call_id=quoteattr(call_id)
+    )
 
-    # TwiML with Stream parameters:
-    # - track="inbound_track" is the only valid value for <Connect> verb
-    # - Custom parameters are sent in the 'start' event to the WebSocket
-    twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say>Connecting you to our reservation system.</Say>
-    <Connect>
-        <Stream url="{websocket_url}" track="inbound_track">
-            <Parameter name="call_id" value="{call_id}" />
-        </Stream>
-    </Connect>
-</Response>"""
-
-    logger.info(f"Generated TwiML for call {call_id}")
+    logger.info("Generated TwiML for call %s", call_id)
     return Response(content=twiml, media_type="text/xml")
 
 
 @app.post("/twilio-status")
-async def twilio_status_callback(request: Request):
-    """Handle Twilio status callbacks for debugging.
+async def twilio_status_callback(
+    request: Request,
+    call_id: str | None = Query(None, description="Call ID of the voice call"),
+):
+    """Handle Twilio status callbacks.
 
-    This endpoint receives updates about call status from Twilio.
+    Calls that end without being answered are marked as failed right away, so
+    whoever waits for the call does not have to run into the timeout. Answered
+    calls are completed by the media stream handler.
     """
     # Get form data from POST request
     form_data = await request.form()
@@ -334,10 +465,16 @@ async def twilio_status_callback(request: Request):
     error_message = data.get("ErrorMessage")
 
     if call_sid and call_status:
-        logger.debug(f"Call {call_sid}: {call_status}")
+        logger.debug("Call %s: %s", call_sid, call_status)
 
     if error_code:
-        logger.error(f"Twilio error {error_code}: {error_message}")
+        logger.error("Twilio error %s: %s", error_code, error_message)
+
+    if call_id and call_status in _UNANSWERED_CALL_STATUSES:
+        call_manager = get_call_manager()
+        call_state = call_manager.get_call(call_id)
+        if call_state and not call_state.completion_event.is_set():
+            call_manager.set_error(call_id, f"Call ended with status {call_status}")
 
     return Response(content="OK", media_type="text/plain")
 
@@ -351,7 +488,7 @@ async def handle_media_stream(websocket: WebSocket):
 
     Reservation details are passed via Twilio custom parameters in the 'start' event.
     """
-    logger.debug(f"WebSocket connection from {websocket.client}")
+    logger.debug("WebSocket connection from %s", websocket.client)
 
     try:
         # Import TwilioHandler
@@ -394,11 +531,26 @@ def run_api():
         os.environ["OPENAI_API_KEY"] = config.openai_api_key
         logger.info("✓ OpenAI API key loaded into environment")
 
-    # Run server
+    # CallManager keeps call state in process memory, so the worker that
+    # places a call must also receive its Twilio media stream
+    if config.web_concurrency > 1:
+        logger.warning(
+            "Running %d workers: call state is not shared between workers",
+            config.web_concurrency,
+        )
+
+    # Imported here: uvicorn workers only need to import concierge.api:app
+    import uvicorn
+
+    # Run server (uvloop is not available on Windows)
     uvicorn.run(
         "concierge.api:app",
         host=config.server_host,
         port=config.server_port,
+        workers=config.web_concurrency,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
         log_level=config.log_level.lower(),
         reload=False,  # Set to True for development
     )
@@ -1,6 +1,7 @@
 """Configuration management for AI Concierge using Pydantic."""
 
 import logging
+from functools import lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -33,6 +34,10 @@ class Config(BaseSettings):
         default="http://localhost:8080",
         description="Server URL for CLI to connect to API",
     )
+    web_concurrency: int = Field(
+        default=1,
+        description="Number of uvicorn worker processes (call state is per process)",
+    )
     public_domain: str | None = Field(
         None, description="Public domain for Twilio webhooks (e.g., abc123.ngrok.io)"
     )
@@ -69,6 +74,18 @@ class Config(BaseSettings):
         description="Voice for realtime agent (alloy, echo, fable, onyx, nova, shimmer)",
     )
 
+    # Audio Streaming Configuration
+    audio_chunk_ms: int = Field(
+        default=100,
+        ge=20,
+        description="Twilio audio buffered per send to OpenAI, in milliseconds",
+    )
+    twilio_audio_queue_size: int = Field(
+        default=16,
+        ge=1,
+        description="Max audio chunks queued for Twilio before the session waits",
+    )
+
     def has_twilio_config(self) -> bool:
         """Check if Twilio is properly configured."""
         return bool(
@@ -89,16 +106,10 @@ class Config(BaseSettings):
             logger.warning("TWILIO_PHONE_NUMBER not set - Twilio features disabled")
 
 
-# Global config instance
-config: Config | None = None
-
-
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get or create the global configuration instance."""
-    global config
-    if config is None:
-        config = Config()
-    return config
+    return Config()
 
 
 def setup_logging(cfg: Config | None = None) -> None:
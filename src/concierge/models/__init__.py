@@ -1,5 +1,6 @@
 """Data models for the AI Concierge system."""
 
+from concierge.models.api import HealthResponse, ProcessRequestResponse
 from concierge.models.call import (
     ConfirmedReservationDetails,
     VoiceCallResult,
@@ -14,6 +15,8 @@ from concierge.models.restaurant import Restaurant
 
 __all__ = [
     "ConfirmedReservationDetails",
+    "HealthResponse",
+    "ProcessRequestResponse",
     "ReservationDetails",
     "ReservationRequest",
     "ReservationResult",
@@ -0,0 +1,22 @@
+"""API response models."""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class HealthResponse(BaseModel):
+    """Response body for the health check endpoint."""
+
+    status: str
+    service: str
+
+
+class ProcessRequestResponse(BaseModel):
+    """Response body for a successfully processed request."""
+
+    success: bool
+    message: str
+    final_output: Any
+    formatted_result: str
+    session_id: str  # Returned for client to reuse
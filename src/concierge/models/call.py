@@ -1,11 +1,13 @@
 """Voice call data models."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VoiceCallResult(BaseModel):
     """Structured output for voice call reservation result."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str  # "confirmed", "pending", "rejected", "error"
     restaurant_name: str
     confirmation_number: str | None = None
@@ -19,6 +21,8 @@ class VoiceCallResult(BaseModel):
 class ConfirmedReservationDetails(BaseModel):
     """Extracted details from a completed reservation call."""
 
+    model_config = ConfigDict(frozen=True)
+
     confirmed_time: str | None = Field(
         None, description="The ACTUAL confirmed time (e.g., '20:00', '8:00 PM')"
     )
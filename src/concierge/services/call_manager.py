@@ -1,60 +1,77 @@
 """Call state management for tracking reservation calls."""
 
+import asyncio
+import heapq
 import logging
-import uuid
-from datetime import datetime
+import secrets
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import ClassVar
 
-from pydantic import BaseModel, Field
-
 logger = logging.getLogger(__name__)
 
+# Transcript lines kept per call; the oldest lines are dropped beyond this
+MAX_TRANSCRIPT_LINES = 2000
+
+
+@dataclass(slots=True, kw_only=True)
+class CallState:
+    """State for an active or completed reservation call.
+
+    Attributes:
+        call_id: Unique call identifier
+        call_sid: Twilio call SID
+        status: Call status: initiated, ringing, in_progress, completed, failed
+        reservation_details: Reservation information
+        transcript: Conversation transcript, capped at MAX_TRANSCRIPT_LINES lines
+        transcript_chars: Length of the transcript lines plus one separator each
+        confirmation_number: Extracted confirmation number
+        start_time: Call start time
+        end_time: Call end time
+        error_message: Error message if failed
+        completion_event: Set once the call reaches completed or failed
+        analysis_event: Set once transcript analysis has finished
+        analysis_task: Background transcript analysis of a completed call
+    """
 
-class CallState(BaseModel):
-    """State for an active or completed reservation call."""
-
-    call_id: str = Field(description="Unique call identifier")
-    call_sid: str | None = Field(None, description="Twilio call SID")
-    status: str = Field(
-        default="initiated",
-        description="Call status: initiated, ringing, in_progress, completed, failed",
-    )
-    reservation_details: dict = Field(description="Reservation information")
-    transcript: list[str] = Field(
-        default_factory=list, description="Conversation transcript"
-    )
-    confirmation_number: str | None = Field(
-        None, description="Extracted confirmation number"
+    call_id: str
+    reservation_details: dict
+    call_sid: str | None = None
+    status: str = "initiated"
+    transcript: deque[str] = field(
+        default_factory=lambda: deque(maxlen=MAX_TRANSCRIPT_LINES)
     )
-    start_time: datetime = Field(default_factory=datetime.now)
-    end_time: datetime | None = Field(None, description="Call end time")
-    error_message: str | None = Field(None, description="Error message if failed")
+    transcript_chars: int = 0
+    confirmation_number: str | None = None
+    start_time: datetime = field(default_factory=datetime.now)
+    end_time: datetime | None = None
+    error_message: str | None = None
+    completion_event: asyncio.Event = field(default_factory=asyncio.Event)
+    analysis_event: asyncio.Event = field(default_factory=asyncio.Event)
+    analysis_task: asyncio.Task | None = None
 
 
 class CallManager:
     """Manages state for active and completed reservation calls.
 
-    This is a singleton that stores call state in memory.
-    For production, consider using Redis or a database.
+    Call state is stored in memory and shared by the module-level instance
+    returned from get_call_manager(). For production, consider using Redis or
+    a database.
     """
 
-    _instance: ClassVar["CallManager | None"] = None
     _active_calls: ClassVar[dict[str, CallState]] = {}
-
-    def __new__(cls) -> "CallManager":
-        """Ensure only one instance exists (singleton pattern)."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    # (end_time, call_id) of finished calls, oldest first, for cleanup
+    _expiry_heap: ClassVar[list[tuple[datetime, str]]] = []
 
     @staticmethod
     def generate_call_id() -> str:
         """Generate a unique call identifier.
 
         Returns:
-            UUID-based call ID
+            URL-safe random call ID (128 bits)
         """
-        return str(uuid.uuid4())
+        return secrets.token_urlsafe(16)
 
     def create_call(
         self, reservation_details: dict, call_id: str | None = None
@@ -78,7 +95,7 @@ class CallManager:
         )
 
         self._active_calls[call_id] = call_state
-        logger.info(f"Created call {call_id}")
+        logger.info("Created call %s", call_id)
 
         return call_state
 
@@ -103,21 +120,45 @@ class CallManager:
         call_state = self._active_calls.get(call_id)
         if call_state:
             call_state.status = status
-            logger.info(f"Call {call_id} status updated to {status}")
+            logger.info("Call %s status updated to %s", call_id, status)
 
             if status in ("completed", "failed"):
-                call_state.end_time = datetime.now()
+                self._mark_ended(call_state)
 
-                # On completion, use LLM to analyze the transcript and extract confirmed details
+                # On completion, use LLM to analyze the transcript and extract
+                # confirmed details. This runs in the background so the caller
+                # is not held up by the LLM; waiters use analysis_event.
                 if status == "completed":
-                    await self.analyze_and_update_confirmation(call_id)
-
-                    if not call_state.confirmation_number:
-                        logger.warning(
-                            f"⚠ Call {call_id} completed without confirmation number. Transcript length: {len(call_state.transcript)}"
-                        )
+                    call_state.analysis_task = asyncio.create_task(
+                        self._analyze_completed_call(call_state)
+                    )
         else:
-            logger.warning(f"Attempted to update non-existent call {call_id}")
+            logger.warning("Attempted to update non-existent call %s", call_id)
+
+    async def _analyze_completed_call(self, call_state: CallState) -> None:
+        """Analyze the transcript of a completed call.
+
+        Args:
+            call_state: Call that has just completed
+        """
+        await self.analyze_and_update_confirmation(call_state.call_id)
+
+        if not call_state.confirmation_number:
+            logger.warning(
+                "⚠ Call %s completed without confirmation number. Transcript length: %d",
+                call_state.call_id,
+                len(call_state.transcript),
+            )
+
+    def _mark_ended(self, call_state: CallState) -> None:
+        """Record the end time of a call, schedule it for cleanup and wake waiters.
+
+        Args:
+            call_state: Call that reached a terminal status
+        """
+        call_state.end_time = datetime.now()
+        heapq.heappush(self._expiry_heap, (call_state.end_time, call_state.call_id))
+        call_state.completion_event.set()
 
     def set_call_sid(self, call_id: str, call_sid: str) -> None:
         """Set Twilio call SID.
@@ -129,7 +170,7 @@ class CallManager:
         call_state = self._active_calls.get(call_id)
         if call_state:
             call_state.call_sid = call_sid
-            logger.info(f"Call {call_id} linked to Twilio SID {call_sid}")
+            logger.info("Call %s linked to Twilio SID %s", call_id, call_sid)
 
     def append_transcript(self, call_id: str, text: str) -> None:
         """Add to conversation transcript.
@@ -140,8 +181,12 @@ class CallManager:
         """
         call_state = self._active_calls.get(call_id)
         if call_state:
-            call_state.transcript.append(text)
-            logger.debug(f"Call {call_id} transcript: {text}")
+            transcript = call_state.transcript
+            if len(transcript) == transcript.maxlen:
+                call_state.transcript_chars -= len(transcript[0]) + 1
+            transcript.append(text)
+            call_state.transcript_chars += len(text) + 1
+            logger.debug("Call %s transcript: %s", call_id, text)
 
             # Note: Confirmation extraction now happens once at the end via LLM
             # when update_status("completed") is called
@@ -157,8 +202,8 @@ class CallManager:
         if call_state:
             call_state.error_message = error_message
             call_state.status = "failed"
-            call_state.end_time = datetime.now()
-            logger.error(f"Call {call_id} failed: {error_message}")
+            self._mark_ended(call_state)
+            logger.error("Call %s failed: %s", call_id, error_message)
 
     async def analyze_and_update_confirmation(self, call_id: str) -> None:
         """Analyze the call transcript using LLM and update confirmed details.
@@ -171,12 +216,17 @@ class CallManager:
         """
         call_state = self._active_calls.get(call_id)
         if not call_state or not call_state.transcript:
-            logger.warning(f"No transcript found for call {call_id}")
+            logger.warning("No transcript found for call %s", call_id)
+            if call_state:
+                call_state.analysis_event.set()
             return
 
-        logger.info(f"🤖 Analyzing transcript with LLM for call {call_id}")
+        logger.info("🤖 Analyzing transcript with LLM for call %s", call_id)
         logger.info(
-            f"   Transcript has {len(call_state.transcript)} lines, {len(' '.join(call_state.transcript))} chars"
+            "   Transcript has %d lines, %d chars",
+            len(call_state.transcript),
+            # Length of the lines joined by spaces: one separator fewer
+            call_state.transcript_chars - 1,
         )
 
         try:
@@ -192,7 +242,8 @@ class CallManager:
             if confirmed_details.confirmation_number:
                 call_state.confirmation_number = confirmed_details.confirmation_number
                 logger.info(
-                    f"✓ LLM extracted confirmation number: {confirmed_details.confirmation_number}"
+                    "✓ LLM extracted confirmation number: %s",
+                    confirmed_details.confirmation_number,
                 )
             else:
                 logger.warning("⚠ LLM did not extract a confirmation number")
@@ -203,7 +254,8 @@ class CallManager:
                     confirmed_details.confirmed_time
                 )
                 logger.info(
-                    f"✓ LLM extracted confirmed time: {confirmed_details.confirmed_time}"
+                    "✓ LLM extracted confirmed time: %s",
+                    confirmed_details.confirmed_time,
                 )
 
             if confirmed_details.confirmed_date:
@@ -211,7 +263,8 @@ class CallManager:
                     confirmed_details.confirmed_date
                 )
                 logger.info(
-                    f"✓ LLM extracted confirmed date: {confirmed_details.confirmed_date}"
+                    "✓ LLM extracted confirmed date: %s",
+                    confirmed_details.confirmed_date,
                 )
 
             if confirmed_details.restaurant_notes:
@@ -219,19 +272,22 @@ class CallManager:
                     confirmed_details.restaurant_notes
                 )
                 logger.info(
-                    f"✓ LLM extracted notes: {confirmed_details.restaurant_notes}"
+                    "✓ LLM extracted notes: %s", confirmed_details.restaurant_notes
                 )
 
             call_state.reservation_details["was_modified"] = (
                 confirmed_details.was_modified
             )
 
-            logger.info(f"✓ Transcript analysis complete for call {call_id}")
+            logger.info("✓ Transcript analysis complete for call %s", call_id)
 
         except Exception as e:
-            logger.error(f"Error analyzing transcript with LLM: {e}", exc_info=True)
+            logger.error("Error analyzing transcript with LLM: %s", e, exc_info=True)
             # Fallback: don't update anything, keep the call as-is
 
+        finally:
+            call_state.analysis_event.set()
+
     def get_all_calls(self) -> list[CallState]:
         """Get all active calls.
 
@@ -249,24 +305,26 @@ class CallManager:
         Returns:
             Number of calls removed
         """
-        now = datetime.now()
-        to_remove = []
+        cutoff = datetime.now() - timedelta(minutes=max_age_minutes)
+        removed = 0
+
+        # Only calls that have actually expired are visited
+        while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+            end_time, call_id = heapq.heappop(self._expiry_heap)
+            call_state = self._active_calls.get(call_id)
 
-        for call_id, call_state in self._active_calls.items():
-            if call_state.status in ("completed", "failed") and call_state.end_time:
-                age_minutes = (now - call_state.end_time).total_seconds() / 60
-                if age_minutes > max_age_minutes:
-                    to_remove.append(call_id)
+            # Skip calls already removed or ended again since this entry
+            if call_state is None or call_state.end_time != end_time:
+                continue
 
-        for call_id in to_remove:
             del self._active_calls[call_id]
-            logger.info(f"Cleaned up old call {call_id}")
+            removed += 1
+            logger.info("Cleaned up old call %s", call_id)
 
-        return len(to_remove)
+        return removed
 
 
-# Global singleton instance
-_call_manager: CallManager | None = None
+_CALL_MANAGER = CallManager()
 
 
 def get_call_manager() -> CallManager:
@@ -275,7 +333,4 @@ def get_call_manager() -> CallManager:
     Returns:
         CallManager singleton
     """
-    global _call_manager
-    if _call_manager is None:
-        _call_manager = CallManager()
-    return _call_manager
+    return _CALL_MANAGER
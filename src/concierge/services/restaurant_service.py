@@ -1,6 +1,7 @@
 """Restaurant lookup service - Mock implementation for MVP."""
 
 import logging
+from functools import lru_cache
 
 from concierge.config import get_config
 from concierge.models import Restaurant
@@ -24,8 +25,12 @@ class RestaurantService:
             address="123 Demo Street, San Francisco, CA 94102",
             cuisine_type="Italian",
         )
+        # Restaurants by casefolded name, built once for O(1) lookups
+        self._by_name: dict[str, Restaurant] = {
+            self.demo_restaurant.name.casefold(): self.demo_restaurant
+        }
         logger.info(
-            f"Initialized restaurant service with demo: {self.demo_restaurant.name}"
+            "Initialized restaurant service with demo: %s", self.demo_restaurant.name
         )
 
     def find_restaurant(self, restaurant_name: str) -> Restaurant | None:
@@ -37,15 +42,11 @@ class RestaurantService:
         Returns:
             Restaurant object if found, None otherwise
         """
-        logger.info(f"Looking up restaurant: {restaurant_name}")
+        logger.debug("Looking up restaurant: %s", restaurant_name)
 
-        # For MVP, always return the demo restaurant regardless of the name
+        # For MVP, fall back to the demo restaurant for unknown names
         # This allows testing with any restaurant name
-        logger.info(
-            f"Returning demo restaurant '{self.demo_restaurant.name}' "
-            f"for search query '{restaurant_name}'"
-        )
-        return self.demo_restaurant
+        return self._by_name.get(restaurant_name.casefold(), self.demo_restaurant)
 
     def get_demo_restaurant(self) -> Restaurant:
         """Get the demo restaurant directly.
@@ -54,3 +55,13 @@ class RestaurantService:
             The demo restaurant object
         """
         return self.demo_restaurant
+
+
+@lru_cache(maxsize=1)
+def get_restaurant_service() -> RestaurantService:
+    """Get the shared RestaurantService instance.
+
+    Returns:
+        RestaurantService singleton
+    """
+    return RestaurantService()
@@ -5,11 +5,12 @@ https://github.com/openai/openai-agents-python/tree/main/examples/realtime/twili
 """
 
 import asyncio
-import base64
+import binascii
 import json
 import logging
 import os
-import time
+from collections import deque
+from contextlib import suppress
 from typing import Any
 from starlette.websockets import WebSocketDisconnect
 from fastapi import WebSocket
@@ -26,6 +27,47 @@ from concierge.config import get_config
 
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 70
+
+# Outbound media and mark frames only differ in streamSid and one string value,
+# so they are built from a per-stream prefix plus this suffix instead of going
+# through json.dumps. Base64 payloads and numeric mark names never need escaping.
+_FRAME_SUFFIX = '"}}'
+
+
+def _frame_prefix(event: str, key: str, stream_sid: str | None) -> str:
+    """Build the JSON prefix of a Twilio frame up to its string value."""
+    return (
+        f'{{"event":"{event}","streamSid":{json.dumps(stream_sid)},'
+        f'"{event}":{{"{key}":"'
+    )
+
+
+_MEDIA_EVENT_PREFIX = '{"event":"media"'
+_PAYLOAD_KEY = '"payload":"'
+
+
+def _media_payload(message_text: str) -> str | None:
+    """Extract the audio payload from a raw Twilio media frame.
+
+    Returns None when the frame is not a media event or does not have the
+    expected shape, in which case it should be parsed as JSON.
+    """
+    if not message_text.startswith(_MEDIA_EVENT_PREFIX):
+        return None
+    start = message_text.find(_PAYLOAD_KEY)
+    if start == -1:
+        return None
+    start += len(_PAYLOAD_KEY)
+    end = message_text.find('"', start)
+    if end == -1:
+        return None
+    payload = message_text[start:end]
+    # Escaped characters (e.g. "\/") need a real JSON parse
+    if "\\" in payload:
+        return None
+    return payload
+
 
 class TwilioHandler:
     """Handler for Twilio Media Streams WebSocket connections.
@@ -43,24 +85,43 @@ class TwilioHandler:
         self.twilio_websocket = twilio_websocket
         self.call_id: str | None = None  # Will be populated from 'start' event
         self._message_loop_task: asyncio.Task[None] | None = None
+        self._session_tasks: list[asyncio.Task[None]] = []
         self.session: RealtimeSession | None = None
         self.playback_tracker = RealtimePlaybackTracker()
         self._start_event_received = asyncio.Event()  # Wait for 'start' event
         self._openai_connected = asyncio.Event()  # Wait for OpenAI connection
 
-        # Audio buffering configuration
-        self.CHUNK_LENGTH_S = 0.05  # 50ms chunks
+        config = get_config()
+
+        # Audio buffering configuration. Twilio sends 20ms frames; several are
+        # coalesced into one send to OpenAI. This trades up to
+        # audio_chunk_ms of added input latency for fewer WebSocket sends.
+        self.CHUNK_LENGTH_S = config.audio_chunk_ms / 1000
         self.SAMPLE_RATE = 8000  # Twilio uses 8kHz for g711_ulaw
         self.BUFFER_SIZE_BYTES = int(self.SAMPLE_RATE * self.CHUNK_LENGTH_S)
 
         self._stream_sid: str | None = None
+        self._set_frame_templates()
         self._call_sid: str | None = None
-        self._audio_buffer: bytearray = bytearray()
-        self._last_buffer_send_time = time.time()
+        # Inbound audio is kept as a list of frames and joined once per flush
+        self._audio_chunks: list[bytes] = []
+        self._audio_buffer_len = 0
+        self._last_buffer_send_time = 0.0  # Event loop clock, see loop.time()
+
+        # Outbound audio batching (OpenAI -> Twilio)
+        self.OUTBOUND_BATCH_S = 0.04  # Coalesce up to 40ms of audio per media frame
+        self.OUTBOUND_BATCH_WINDOW_S = 0.01  # Wait at most 10ms for more audio
+        self.OUTBOUND_BATCH_BYTES = int(self.SAMPLE_RATE * self.OUTBOUND_BATCH_S)
+        # Bounded so bursts of OpenAI audio apply backpressure to the session
+        self._outbound_audio: asyncio.Queue[tuple[str, int, bytes]] = asyncio.Queue(
+            maxsize=config.twilio_audio_queue_size
+        )
+        self._audio_interrupt_count = 0
 
         # Mark event tracking for playback
         self._mark_counter = 0
-        self._mark_data: dict[str, tuple[str, int, int]] = {}
+        # (mark number, item_id, content_index, duration_ms) in send order
+        self._pending_marks: deque[tuple[int, str, int, float]] = deque()
 
     async def start(self) -> None:
         """Start the Twilio Media Streams session."""
@@ -90,17 +151,17 @@ class TwilioHandler:
         call_state = call_manager.get_call(self.call_id)
 
         if not call_state:
-            logger.error(f"❌ Call {self.call_id} not found in CallManager")
+            logger.error("❌ Call %s not found in CallManager", self.call_id)
             return
 
         reservation_details = call_state.reservation_details
         call_type = reservation_details.get("call_type", "reservation")
 
-        logger.info("=" * 70)
+        logger.info(_BANNER)
         logger.info("✓ Got call details from CallManager:")
-        logger.info(f"  Restaurant: {reservation_details.get('restaurant_name')}")
-        logger.info(f"  Call type: {call_type}")
-        logger.info("=" * 70)
+        logger.info("  Restaurant: %s", reservation_details.get("restaurant_name"))
+        logger.info("  Call type: %s", call_type)
+        logger.info(_BANNER)
 
         # Prepare context for the agent
         # We can pass the whole reservation_details dict as context
@@ -125,7 +186,9 @@ class TwilioHandler:
         agent = voice_agent_instance.create()
 
         logger.info(
-            f"✅ Agent created: {type(agent).__name__} (name: {getattr(agent, 'name', 'N/A')})"
+            "✅ Agent created: %s (name: %s)",
+            type(agent).__name__,
+            getattr(agent, "name", "N/A"),
         )
 
         # Create RealtimeRunner (no config in constructor - just the agent)
@@ -163,8 +226,11 @@ class TwilioHandler:
 
         # Start async loops for handling Realtime events and buffer flushing
         # (message loop already started earlier to get 'start' event)
-        self._realtime_session_task = asyncio.create_task(self._realtime_session_loop())
-        self._buffer_flush_task = asyncio.create_task(self._buffer_flush_loop())
+        self._session_tasks = [
+            asyncio.create_task(self._realtime_session_loop()),
+            asyncio.create_task(self._buffer_flush_loop()),
+            asyncio.create_task(self._twilio_audio_writer_loop()),
+        ]
 
         # Trigger the agent to start speaking immediately
         # This is critical for the agent to begin the conversation
@@ -174,7 +240,25 @@ class TwilioHandler:
     async def wait_until_done(self) -> None:
         """Wait until the session is complete."""
         assert self._message_loop_task is not None
-        await self._message_loop_task
+        try:
+            await self._message_loop_task
+        finally:
+            await self._shutdown()
+
+    async def _shutdown(self) -> None:
+        """Stop the session loops and close the Realtime session.
+
+        The Twilio message loop ends when the call hangs up; the other loops
+        run forever and would otherwise outlive the call.
+        """
+        for task in self._session_tasks:
+            task.cancel()
+        await asyncio.gather(*self._session_tasks, return_exceptions=True)
+        self._session_tasks.clear()
+
+        if self.session:
+            with suppress(Exception):
+                await self.session.close()
 
     async def _realtime_session_loop(self) -> None:
         """Listen for events from the OpenAI Realtime session."""
@@ -196,6 +280,14 @@ class TwilioHandler:
         try:
             while True:
                 message_text = await self.twilio_websocket.receive_text()
+
+                # Media frames dominate the stream: slice the payload out
+                # directly instead of building the full message dict
+                payload = _media_payload(message_text)
+                if payload is not None:
+                    await self._handle_media_payload(payload)
+                    continue
+
                 message = json.loads(message_text)
                 await self._handle_twilio_message(message)
         except WebSocketDisconnect:
@@ -210,11 +302,11 @@ class TwilioHandler:
         """Handle events from the OpenAI Realtime session."""
         # Only log important event types
         if event.type in ("transcript", "history_updated", "audio_end"):
-            logger.debug(f"Realtime event: {event.type}")
+            logger.debug("Realtime event: %s", event.type)
 
         # Try to extract and log any text content from ANY event for debugging
         if hasattr(event, "text") and event.text:
-            logger.info(f"📝 Event text [{event.type}]: {event.text}")
+            logger.info("📝 Event text [%s]: %s", event.type, event.text)
             if self.call_id:
                 from concierge.services.call_manager import get_call_manager
 
@@ -224,56 +316,26 @@ class TwilioHandler:
                 )
 
         if event.type == "audio":
-            # Send audio to Twilio
-            try:
-                base64_audio = base64.b64encode(event.audio.data).decode("utf-8")
-                logger.debug(
-                    f"Sending {len(event.audio.data)} bytes of audio to Twilio"
-                )
-                await self.twilio_websocket.send_text(
-                    json.dumps(
-                        {
-                            "event": "media",
-                            "streamSid": self._stream_sid,
-                            "media": {"payload": base64_audio},
-                        }
-                    )
-                )
-
-                # Send mark event for playback tracking
-                self._mark_counter += 1
-                mark_id = str(self._mark_counter)
-                self._mark_data[mark_id] = (
-                    event.audio.item_id,
-                    event.audio.content_index,
-                    len(event.audio.data),
-                )
-
-                await self.twilio_websocket.send_text(
-                    json.dumps(
-                        {
-                            "event": "mark",
-                            "streamSid": self._stream_sid,
-                            "mark": {"name": mark_id},
-                        }
-                    )
-                )
-            except Exception as e:
-                # WebSocket might be closed if call ended
-                logger.debug(
-                    f"Could not send audio to Twilio (call may have ended): {e}"
-                )
+            # Hand audio to the writer loop, which batches it for Twilio.
+            # OpenAI sends audio faster than realtime, so a full queue is
+            # normal during a burst: wait for the writer instead of dropping
+            # speech.
+            await self._outbound_audio.put(
+                (event.audio.item_id, event.audio.content_index, event.audio.data)
+            )
 
         elif event.type == "audio_interrupted":
             logger.info("Audio interrupted - clearing Twilio buffer")
-            await self.twilio_websocket.send_text(
-                json.dumps({"event": "clear", "streamSid": self._stream_sid})
-            )
+            # Drop audio that has not been sent yet, it would play after the clear
+            self._audio_interrupt_count += 1
+            while not self._outbound_audio.empty():
+                self._outbound_audio.get_nowait()
+            await self.twilio_websocket.send_text(self._clear_frame)
         elif event.type == "transcript":
             # Log both role and text to understand who said what
             role = getattr(event, "role", "unknown")
             text = event.text
-            logger.info(f"📝 Transcript [{role}]: {text}")
+            logger.info("📝 Transcript [%s]: %s", role, text)
 
             # Add transcript to CallManager
             if self.call_id:
@@ -336,7 +398,9 @@ class TwilioHandler:
 
                             if transcript_text and self.call_id:
                                 logger.info(
-                                    f"📝 History transcript [{role}]: {transcript_text}"
+                                    "📝 History transcript [%s]: %s",
+                                    role,
+                                    transcript_text,
                                 )
                                 from concierge.services.call_manager import (
                                     get_call_manager,
@@ -350,6 +414,94 @@ class TwilioHandler:
         elif event.type == "audio_end":
             logger.debug("Audio stream ended")
 
+    async def _twilio_audio_writer_loop(self) -> None:
+        """Send outbound audio to Twilio, coalescing adjacent chunks.
+
+        OpenAI emits many small audio events; merging consecutive chunks of the
+        same content part into one media frame saves a WebSocket send (and the
+        matching mark) per chunk.
+        """
+        # Chunk that ended the previous batch, with the interrupt count at the
+        # time it was taken off the queue
+        pending: tuple[int, tuple[str, int, bytes]] | None = None
+        try:
+            while True:
+                if pending is None:
+                    item_id, content_index, audio = await self._outbound_audio.get()
+                    interrupt_count = self._audio_interrupt_count
+                else:
+                    interrupt_count, (item_id, content_index, audio) = pending
+                    pending = None
+                chunks = [audio]
+                batch_bytes = len(audio)
+
+                # Collect more audio until the batch is full or the stream pauses
+                while batch_bytes < self.OUTBOUND_BATCH_BYTES:
+                    try:
+                        next_audio = await asyncio.wait_for(
+                            self._outbound_audio.get(), self.OUTBOUND_BATCH_WINDOW_S
+                        )
+                    except TimeoutError:
+                        break
+
+                    # Only merge audio that belongs to the same content part
+                    if next_audio[:2] != (item_id, content_index):
+                        pending = (self._audio_interrupt_count, next_audio)
+                        break
+
+                    chunks.append(next_audio[2])
+                    batch_bytes += len(next_audio[2])
+
+                # Audio was interrupted while batching - discard the batch
+                if interrupt_count != self._audio_interrupt_count:
+                    continue
+
+                await self._send_audio_to_twilio(
+                    item_id, content_index, b"".join(chunks)
+                )
+
+        except Exception:
+            logger.exception("Error in Twilio audio writer loop")
+
+    def _set_frame_templates(self) -> None:
+        """Pre-build the outbound frame scaffolding for the current stream."""
+        self._media_prefix = _frame_prefix("media", "payload", self._stream_sid)
+        self._mark_prefix = _frame_prefix("mark", "name", self._stream_sid)
+        self._clear_frame = json.dumps(
+            {"event": "clear", "streamSid": self._stream_sid}
+        )
+
+    async def _send_audio_to_twilio(
+        self, item_id: str, content_index: int, audio: bytes
+    ) -> None:
+        """Send one media frame plus its playback mark to Twilio."""
+        try:
+            base64_audio = binascii.b2a_base64(audio, newline=False).decode("ascii")
+            logger.debug("Sending %d bytes of audio to Twilio", len(audio))
+            await self.twilio_websocket.send_text(
+                self._media_prefix + base64_audio + _FRAME_SUFFIX
+            )
+
+            # Send mark event for playback tracking
+            self._mark_counter += 1
+            mark_id = str(self._mark_counter)
+            # g711_ulaw is one byte per sample, so the duration is known here
+            self._pending_marks.append(
+                (
+                    self._mark_counter,
+                    item_id,
+                    content_index,
+                    len(audio) * 1000 / self.SAMPLE_RATE,
+                )
+            )
+
+            await self.twilio_websocket.send_text(
+                self._mark_prefix + mark_id + _FRAME_SUFFIX
+            )
+        except Exception as e:
+            # WebSocket might be closed if call ended
+            logger.debug("Could not send audio to Twilio (call may have ended): %s", e)
+
     async def _handle_twilio_message(self, message: dict[str, Any]) -> None:
         """Handle incoming messages from Twilio Media Stream."""
         try:
@@ -360,6 +512,7 @@ class TwilioHandler:
             elif event == "start":
                 start_data = message.get("start", {})
                 self._stream_sid = start_data.get("streamSid")
+                self._set_frame_templates()
                 self._call_sid = start_data.get("callSid")
 
                 # Extract custom parameters (only call_id needed now)
@@ -367,7 +520,10 @@ class TwilioHandler:
                 self.call_id = custom_params.get("call_id")
 
                 logger.info(
-                    f"📞 Stream started - CallID: {self.call_id}, StreamSid: {self._stream_sid}, CallSid: {self._call_sid}"
+                    "📞 Stream started - CallID: %s, StreamSid: %s, CallSid: %s",
+                    self.call_id,
+                    self._stream_sid,
+                    self._call_sid,
                 )
 
                 # Update CallManager status to in_progress
@@ -397,40 +553,48 @@ class TwilioHandler:
                     if call_state:
                         logger.info("📊 Call Summary:")
                         logger.info(
-                            f"  - Transcript lines: {len(call_state.transcript)}"
-                        )
-                        logger.debug(
-                            f"  - Full transcript: {' | '.join(call_state.transcript)}"
+                            "  - Transcript lines: %d", len(call_state.transcript)
                         )
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "  - Full transcript: %s",
+                                " | ".join(call_state.transcript),
+                            )
                         logger.info(
-                            f"  - Confirmation number: {call_state.confirmation_number}"
+                            "  - Confirmation number: %s",
+                            call_state.confirmation_number,
                         )
 
                     await call_manager.update_status(self.call_id, "completed")
-                    logger.info(f"✓ Updated call {self.call_id} status to completed")
+                    logger.info("✓ Updated call %s status to completed", self.call_id)
         except Exception:
             logger.exception("Error handling Twilio message")
 
     async def _handle_media_event(self, message: dict[str, Any]) -> None:
         """Handle audio data from Twilio - buffer before sending to OpenAI."""
         media = message.get("media", {})
-        payload = media.get("payload", "")
+        await self._handle_media_payload(media.get("payload", ""))
 
+    async def _handle_media_payload(self, payload: str) -> None:
+        """Buffer one base64 µ-law payload from Twilio."""
         if payload:
             try:
                 # Decode base64 audio from Twilio (µ-law format)
-                ulaw_bytes = base64.b64decode(payload)
+                ulaw_bytes = binascii.a2b_base64(payload)
                 logger.debug(
-                    f"🎤 Received {len(ulaw_bytes)} bytes from Twilio, buffer size: {len(self._audio_buffer)}"
+                    "🎤 Received %d bytes from Twilio, buffer size: %d",
+                    len(ulaw_bytes),
+                    self._audio_buffer_len,
                 )
 
                 # Add to buffer
-                self._audio_buffer.extend(ulaw_bytes)
+                self._audio_chunks.append(ulaw_bytes)
+                self._audio_buffer_len += len(ulaw_bytes)
 
                 # Send buffered audio if we have enough data
-                if len(self._audio_buffer) >= self.BUFFER_SIZE_BYTES:
+                if self._audio_buffer_len >= self.BUFFER_SIZE_BYTES:
                     logger.debug(
-                        f"📤 Flushing {len(self._audio_buffer)} bytes to OpenAI"
+                        "📤 Flushing %d bytes to OpenAI", self._audio_buffer_len
                     )
                     await self._flush_audio_buffer()
 
@@ -441,29 +605,28 @@ class TwilioHandler:
         """Handle mark events from Twilio to update playback tracker."""
         try:
             mark_data = message.get("mark", {})
-            mark_id = mark_data.get("name", "")
+            mark_number = int(mark_data.get("name", "0"))
 
-            # Look up stored data for this mark ID
-            if mark_id in self._mark_data:
-                item_id, item_content_index, byte_count = self._mark_data[mark_id]
+            # Twilio echoes marks in the order they were sent, so anything
+            # queued before this mark will not be reported any more
+            pending = self._pending_marks
+            while pending and pending[0][0] < mark_number:
+                pending.popleft()
 
-                # Convert byte count back to bytes for playback tracker
-                audio_bytes = b"\x00" * byte_count
+            if pending and pending[0][0] == mark_number:
+                _, item_id, item_content_index, duration_ms = pending.popleft()
 
                 # Update playback tracker
-                self.playback_tracker.on_play_bytes(
-                    item_id, item_content_index, audio_bytes
+                self.playback_tracker.on_play_ms(
+                    item_id, item_content_index, duration_ms
                 )
 
-                # Clean up
-                del self._mark_data[mark_id]
-
         except Exception:
             logger.exception("Error handling mark event")
 
     async def _flush_audio_buffer(self) -> None:
         """Send buffered audio to OpenAI."""
-        if not self._audio_buffer or not self.session:
+        if not self._audio_chunks or not self.session:
             return
 
         # Wait for OpenAI to be connected before sending audio
@@ -471,26 +634,29 @@ class TwilioHandler:
             return
 
         try:
-            buffer_data = bytes(self._audio_buffer)
+            buffer_data = b"".join(self._audio_chunks)
             await self.session.send_audio(buffer_data)
 
             # Clear buffer
-            self._audio_buffer.clear()
-            self._last_buffer_send_time = time.time()
+            self._audio_chunks.clear()
+            self._audio_buffer_len = 0
+            self._last_buffer_send_time = asyncio.get_running_loop().time()
 
         except Exception:
             logger.exception("Error sending buffered audio to OpenAI")
 
     async def _buffer_flush_loop(self) -> None:
         """Periodically flush audio buffer to prevent stale data."""
+        loop = asyncio.get_running_loop()
+        self._last_buffer_send_time = loop.time()
         try:
             while True:
                 await asyncio.sleep(self.CHUNK_LENGTH_S)
 
                 # If buffer has data and it's been too long, flush it
-                current_time = time.time()
+                current_time = loop.time()
                 if (
-                    self._audio_buffer
+                    self._audio_chunks
                     and current_time - self._last_buffer_send_time
                     > self.CHUNK_LENGTH_S * 2
                 ):
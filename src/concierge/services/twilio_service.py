@@ -1,6 +1,7 @@
 """Twilio service for voice call integration."""
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 from twilio.rest import Client
@@ -9,6 +10,15 @@ from concierge.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Call progress events reported to the status callback URL. A list, since the
+# Twilio client only expands lists into repeated form parameters.
+_STATUS_CALLBACK_EVENTS = ["initiated", "ringing", "answered", "completed"]
+
+# Fallback TwiML when no TwiML URL is given (for testing)
+_DEFAULT_TWIML = (
+    "<Response><Say>Hello, this is a test call from AI Concierge.</Say></Response>"
+)
+
 
 class TwilioService:
     """Service for managing Twilio voice calls and audio streaming.
@@ -19,9 +29,15 @@ class TwilioService:
     - Streaming audio between Twilio and OpenAI Realtime API
     """
 
+    # Characters ignored when comparing phone numbers
+    _PHONE_FORMATTING = str.maketrans("", "", " -()")
+
     def __init__(self) -> None:
         """Initialize the Twilio service."""
         self.config = get_config()
+        self._normalized_demo_number = self.config.demo_restaurant_phone.translate(
+            self._PHONE_FORMATTING
+        )
         if not self.config.has_twilio_config():
             logger.warning("Twilio not configured - service will not be functional")
             self.client = None
@@ -50,27 +66,15 @@ class TwilioService:
         Raises:
             ValueError: If the number is not the demo restaurant number
         """
-        demo_number = self.config.demo_restaurant_phone
-
         # Normalize phone numbers for comparison (remove spaces, dashes, etc.)
-        normalized_demo = (
-            demo_number.replace(" ", "")
-            .replace("-", "")
-            .replace("(", "")
-            .replace(")", "")
-        )
-        normalized_input = (
-            phone_number.replace(" ", "")
-            .replace("-", "")
-            .replace("(", "")
-            .replace(")", "")
-        )
+        normalized_input = phone_number.translate(self._PHONE_FORMATTING)
 
         # Only allow demo restaurant number
-        if normalized_input != normalized_demo:
+        if normalized_input != self._normalized_demo_number:
             raise ValueError(
                 f"Only the demo restaurant number can be called. "
-                f"Attempted: {phone_number}, Allowed: {demo_number}. "
+                f"Attempted: {phone_number}, "
+                f"Allowed: {self.config.demo_restaurant_phone}. "
                 f"This is a safety feature to prevent unauthorized calls."
             )
 
@@ -117,19 +121,11 @@ class TwilioService:
             if twiml_url:
                 call_params["url"] = twiml_url
             else:
-                # Default TwiML for testing
-                call_params["twiml"] = (
-                    "<Response><Say>Hello, this is a test call from AI Concierge.</Say></Response>"
-                )
+                call_params["twiml"] = _DEFAULT_TWIML
 
             if status_callback:
                 call_params["status_callback"] = status_callback
-                call_params["status_callback_event"] = [
-                    "initiated",
-                    "ringing",
-                    "answered",
-                    "completed",
-                ]
+                call_params["status_callback_event"] = _STATUS_CALLBACK_EVENTS
 
             call = self.client.calls.create(**call_params)
 
@@ -193,3 +189,16 @@ class TwilioService:
         except Exception:
             logger.exception("Failed to end call")
             raise
+
+
+@lru_cache(maxsize=1)
+def get_twilio_service() -> TwilioService:
+    """Get the shared TwilioService instance.
+
+    Reusing one instance keeps a single Twilio REST client, and with it
+    its pooled HTTPS connections, for all calls.
+
+    Returns:
+        TwilioService singleton
+    """
+    return TwilioService()
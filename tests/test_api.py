@@ -0,0 +1,195 @@
+"""Tests for the FastAPI endpoints."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from agents import InputGuardrailTripwireTriggered, SQLiteSession
+from fastapi.testclient import TestClient
+
+from concierge import api
+from concierge.api import app, get_orchestrator_agent
+from concierge.services.call_manager import get_call_manager
+
+
+def text_delta(text: str):
+    """Build a streamed raw response event carrying output text."""
+    return SimpleNamespace(
+        type="raw_response_event",
+        data=SimpleNamespace(type="response.output_text.delta", delta=text),
+    )
+
+
+class FakeStreamedResult:
+    """Stand-in for RunResultStreaming that replays a fixed list of events."""
+
+    def __init__(self, events, error: Exception | None = None):
+        self.events = events
+        self.error = error
+        self.final_output = "Table booked"
+
+    async def stream_events(self):
+        for event in self.events:
+            yield event
+        if self.error is not None:
+            raise self.error
+
+
+class TestProcessRequestStream:
+    """Test the Server-Sent Events endpoint."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Create a client with a stub agent and an in-memory session."""
+        monkeypatch.setattr(
+            api, "SQLiteSession", lambda session_id, _db_path: SQLiteSession(session_id)
+        )
+        app.dependency_overrides[get_orchestrator_agent] = object
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def stream(self, client, monkeypatch, result: FakeStreamedResult) -> list[dict]:
+        """Post a request with run_streamed stubbed and return the SSE events."""
+        monkeypatch.setattr(api.Runner, "run_streamed", lambda **_kwargs: result)
+        response = client.post(
+            "/process-request/stream",
+            json={"user_input": "Book a table", "session_id": "session-test"},
+        )
+        assert response.status_code == 200
+        return [
+            json.loads(line.removeprefix("data: "))
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+
+    def test_streams_deltas_and_result(self, client, monkeypatch):
+        """Test that text deltas are streamed before the final result."""
+        events = self.stream(
+            client,
+            monkeypatch,
+            FakeStreamedResult([text_delta("Table "), text_delta("booked")]),
+        )
+
+        assert events[:2] == [
+            {"type": "delta", "text": "Table "},
+            {"type": "delta", "text": "booked"},
+        ]
+        assert events[2]["type"] == "result"
+        assert events[2]["final_output"] == "Table booked"
+        assert events[2]["session_id"] == "session-test"
+        assert len(events) == 3
+
+    def test_guardrail_block_is_reported(self, client, monkeypatch):
+        """Test that a guardrail tripwire ends the stream with an error event."""
+        guardrail_result = SimpleNamespace(
+            guardrail=SimpleNamespace(),
+            output=SimpleNamespace(output_info="Party size too large"),
+        )
+        error = InputGuardrailTripwireTriggered(guardrail_result)
+
+        events = self.stream(client, monkeypatch, FakeStreamedResult([], error))
+
+        assert events == [
+            {
+                "type": "error",
+                "success": False,
+                "error": "Request blocked by guardrail",
+                "message": "Party size too large",
+                "session_id": "session-test",
+            }
+        ]
+
+    def test_agent_error_is_reported(self, client, monkeypatch):
+        """Test that an error during the run ends the stream with an error event."""
+        events = self.stream(
+            client,
+            monkeypatch,
+            FakeStreamedResult([text_delta("Hi")], RuntimeError("boom")),
+        )
+
+        assert events[0] == {"type": "delta", "text": "Hi"}
+        assert events[1]["type"] == "error"
+        assert events[1]["error"] == "boom"
+        assert len(events) == 2
+
+    def test_formatting_error_is_reported(self, client, monkeypatch):
+        """Test that a failure building the result still sends an error event."""
+
+        def fail(_result):
+            msg = "bad result"
+            raise ValueError(msg)
+
+        monkeypatch.setattr(api, "format_reservation_result", fail)
+
+        events = self.stream(client, monkeypatch, FakeStreamedResult([]))
+
+        assert events == [
+            {
+                "type": "error",
+                "success": False,
+                "error": "bad result",
+                "message": "Error processing request: bad result",
+            }
+        ]
+
+    @pytest.mark.parametrize("body", ["{not json", "[]"])
+    def test_invalid_body_is_rejected(self, client, body):
+        """Test that a body that is not a JSON object gets a 400 error."""
+        response = client.post(
+            "/process-request/stream",
+            content=body,
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"error": "Request body must be a JSON object"}
+
+
+class TestTwilioStatusCallback:
+    """Test the Twilio status callback endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client."""
+        return TestClient(app)
+
+    @pytest.fixture
+    def call_state(self):
+        """Register a call and remove it again afterwards."""
+        call_manager = get_call_manager()
+        call_state = call_manager.create_call({"restaurant_name": "Test Restaurant"})
+        yield call_state
+        call_manager._active_calls.pop(call_state.call_id, None)
+
+    def post_status(self, client, status: str, call_id: str | None = None):
+        """Post a Twilio status callback."""
+        params = {"call_id": call_id} if call_id else None
+        response = client.post(
+            "/twilio-status",
+            params=params,
+            data={"CallSid": "CA123", "CallStatus": status},
+        )
+        assert response.status_code == 200
+
+    def test_unanswered_call_fails(self, client, call_state):
+        """Test that a no-answer callback fails the call and wakes waiters."""
+        self.post_status(client, "no-answer", call_state.call_id)
+
+        assert call_state.status == "failed"
+        assert call_state.error_message == "Call ended with status no-answer"
+        assert call_state.completion_event.is_set()
+
+    def test_completed_call_is_left_to_stream_handler(self, client, call_state):
+        """Test that a completed callback does not fail the call."""
+        self.post_status(client, "completed", call_state.call_id)
+
+        assert call_state.status == "initiated"
+        assert not call_state.completion_event.is_set()
+
+    @pytest.mark.parametrize("call_id", [None, "unknown-call"])
+    def test_missing_or_unknown_call_is_ignored(self, client, call_state, call_id):
+        """Test that callbacks without a known call ID change nothing."""
+        self.post_status(client, "busy", call_id)
+
+        assert call_state.status == "initiated"
+        assert not call_state.completion_event.is_set()
@@ -1,7 +1,10 @@
 """Tests for call state management."""
 
+import asyncio
+
 import pytest
 
+from concierge.services import call_manager as call_manager_module
 from concierge.services.call_manager import CallManager, CallState, get_call_manager
 
 
@@ -17,7 +20,7 @@ class TestCallState:
 
         assert call_state.call_id == "test-123"
         assert call_state.status == "initiated"
-        assert call_state.transcript == []
+        assert list(call_state.transcript) == []
         assert call_state.confirmation_number is None
         assert call_state.start_time is not None
         assert call_state.end_time is None
@@ -32,6 +35,7 @@ class TestCallManager:
         # Clear any existing calls
         manager = CallManager()
         manager._active_calls.clear()
+        manager._expiry_heap.clear()
         return manager
 
     def test_generate_call_id(self, call_manager):
@@ -83,10 +87,15 @@ class TestCallManager:
 
         await call_manager.update_status(call_state.call_id, "in_progress")
         assert call_state.status == "in_progress"
+        assert not call_state.completion_event.is_set()
 
         await call_manager.update_status(call_state.call_id, "completed")
         assert call_state.status == "completed"
         assert call_state.end_time is not None
+        assert call_state.completion_event.is_set()
+
+        await call_state.analysis_task
+        assert call_state.analysis_event.is_set()
 
     def test_set_call_sid(self, call_manager):
         """Test setting Twilio call SID."""
@@ -105,6 +114,18 @@ class TestCallManager:
         assert len(call_state.transcript) == 2
         assert call_state.transcript[0] == "Hello"
         assert call_state.transcript[1] == "World"
+        assert call_state.transcript_chars == len("Hello World") + 1
+
+    def test_transcript_is_capped(self, call_manager, monkeypatch):
+        """Test that only the most recent transcript lines are kept."""
+        monkeypatch.setattr(call_manager_module, "MAX_TRANSCRIPT_LINES", 2)
+        call_state = call_manager.create_call({"test": "data"})
+
+        for text in ("one", "two", "three"):
+            call_manager.append_transcript(call_state.call_id, text)
+
+        assert list(call_state.transcript) == ["two", "three"]
+        assert call_state.transcript_chars == len("two three") + 1
 
     def test_set_error(self, call_manager):
         """Test setting error message."""
@@ -115,6 +136,23 @@ class TestCallManager:
         assert call_state.status == "failed"
         assert call_state.error_message == "Test error"
         assert call_state.end_time is not None
+        assert call_state.completion_event.is_set()
+
+    async def test_failed_call_wakes_waiter(self, call_manager):
+        """Test that waiting for a call returns as soon as it fails."""
+        from concierge.agents.tools.voice import wait_for_call_completion
+
+        call_state = call_manager.create_call({"restaurant_name": "Test Restaurant"})
+        waiter = asyncio.create_task(
+            wait_for_call_completion(call_state.call_id, timeout=5)
+        )
+        await asyncio.sleep(0)
+
+        call_manager.set_error(call_state.call_id, "Busy")
+        result = await asyncio.wait_for(waiter, timeout=1)
+
+        assert result.status == "error"
+        assert result.message == "Call failed: Busy"
 
     def test_get_all_calls(self, call_manager):
         """Test getting all calls."""
@@ -126,20 +164,30 @@ class TestCallManager:
 
         assert len(all_calls) == 3
 
-    def test_cleanup_old_calls(self, call_manager):
+    async def test_cleanup_old_calls(self, call_manager, monkeypatch):
         """Test cleanup of old calls."""
         from datetime import datetime, timedelta
 
+        real_now = datetime.now()
+
+        class FrozenDatetime(datetime):
+            current = real_now - timedelta(minutes=120)
+
+            @classmethod
+            def now(cls, tz=None):
+                return cls.current.replace(tzinfo=tz)
+
+        monkeypatch.setattr(call_manager_module, "datetime", FrozenDatetime)
+
         # Create calls
         call1 = call_manager.create_call({"test": "data1"})
         call2 = call_manager.create_call({"test": "data2"})
 
-        # Mark as completed (skip async update for simplicity in this test)
-        call1.status = "completed"
-        call1.end_time = datetime.now() - timedelta(minutes=120)
-
-        call2.status = "failed"
-        call2.end_time = datetime.now() - timedelta(minutes=30)
+        # End call1 two hours ago and call2 half an hour ago
+        await call_manager.update_status(call1.call_id, "completed")
+        FrozenDatetime.current = real_now - timedelta(minutes=30)
+        call_manager.set_error(call2.call_id, "No answer")
+        FrozenDatetime.current = real_now
 
         # Cleanup calls older than 60 minutes
         removed = call_manager.cleanup_old_calls(max_age_minutes=60)
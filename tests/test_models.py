@@ -8,6 +8,7 @@ from concierge.models import (
     ReservationResult,
     ReservationStatus,
     Restaurant,
+    VoiceCallResult,
 )
 
 
@@ -115,6 +116,25 @@ class TestReservationResult:
         assert result.timestamp is not None
 
 
+class TestVoiceCallResult:
+    """Tests for the VoiceCallResult model."""
+
+    def test_voice_call_result_immutable(self):
+        """Test that a call result is frozen and updated by copying."""
+        result = VoiceCallResult(
+            status="confirmed",
+            restaurant_name="Test Restaurant",
+            message="Reservation confirmed",
+        )
+
+        with pytest.raises(ValidationError):
+            result.call_duration = 12.5
+
+        updated = result.model_copy(update={"call_duration": 12.5})
+        assert updated.call_duration == 12.5
+        assert result.call_duration is None
+
+
 class TestReservationStatus:
     """Tests for the ReservationStatus enum."""
 
@@ -3,7 +3,7 @@
 import pytest
 
 from concierge.services.restaurant_service import RestaurantService
-from concierge.services.twilio_service import TwilioService
+from concierge.services.twilio_service import TwilioService, get_twilio_service
 
 
 class TestRestaurantService:
@@ -22,6 +22,14 @@ class TestRestaurantService:
         assert result.name == restaurant_service.demo_restaurant.name
         assert result.phone_number == restaurant_service.demo_restaurant.phone_number
 
+    def test_find_restaurant_ignores_case(self, restaurant_service):
+        """Test that restaurant names are matched case-insensitively."""
+        name = restaurant_service.demo_restaurant.name
+
+        assert restaurant_service.find_restaurant(name.upper()) is (
+            restaurant_service.demo_restaurant
+        )
+
     def test_get_demo_restaurant(self, restaurant_service):
         """Test get_demo_restaurant method."""
         result = restaurant_service.get_demo_restaurant()
@@ -126,3 +134,7 @@ class TestTwilioService:
         if demo_number != "+15555559999":
             with pytest.raises(ValueError, match="Only the demo restaurant number"):
                 twilio_service.initiate_call("+15555559999")
+
+    def test_get_twilio_service_is_shared(self):
+        """Test that get_twilio_service returns the same instance."""
+        assert get_twilio_service() is get_twilio_service()
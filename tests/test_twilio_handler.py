@@ -0,0 +1,228 @@
+"""Tests for the Twilio Media Streams handler."""
+
+import asyncio
+import base64
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from concierge.services.twilio_handler import TwilioHandler, _media_payload
+
+
+class FakeWebSocket:
+    """Minimal stand-in for the Twilio WebSocket that records sent frames."""
+
+    def __init__(self):
+        self.sent: list[dict] = []
+        self.frame_sent = asyncio.Event()
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(json.loads(text))
+        self.frame_sent.set()
+
+    def media_audio(self) -> list[bytes]:
+        """Return the decoded audio of every media frame sent so far."""
+        return [
+            base64.b64decode(frame["media"]["payload"])
+            for frame in self.sent
+            if frame["event"] == "media"
+        ]
+
+    async def wait_for_audio(self, num_bytes: int) -> None:
+        """Wait until media frames carrying num_bytes of audio have been sent."""
+
+        async def audio_sent():
+            while sum(map(len, self.media_audio())) < num_bytes:
+                self.frame_sent.clear()
+                await self.frame_sent.wait()
+
+        await asyncio.wait_for(audio_sent(), timeout=1)
+
+
+class GatedWebSocket(FakeWebSocket):
+    """Fake WebSocket that holds the first media frame until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.media_blocked = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def send_text(self, text: str) -> None:
+        if '"event":"media"' in text and not self.release.is_set():
+            self.media_blocked.set()
+            await self.release.wait()
+        await super().send_text(text)
+
+
+def audio_event(item_id: str, data: bytes, content_index: int = 0):
+    """Build a realtime audio event."""
+    return SimpleNamespace(
+        type="audio",
+        audio=SimpleNamespace(item_id=item_id, content_index=content_index, data=data),
+    )
+
+
+class TestOutboundAudio:
+    """Test sending OpenAI audio to Twilio."""
+
+    @pytest.fixture
+    def handler(self):
+        """Create a handler with a fake Twilio WebSocket."""
+        return TwilioHandler(FakeWebSocket())
+
+    async def test_media_frame_is_valid_json(self, handler):
+        """Test that the templated media frame matches the Twilio format."""
+        await handler._handle_twilio_message(
+            {"event": "start", "start": {"streamSid": "MZ123", "customParameters": {}}}
+        )
+
+        await handler._send_audio_to_twilio("item-1", 0, b"\x01\x02\x03")
+
+        media, mark = handler.twilio_websocket.sent
+        assert media == {
+            "event": "media",
+            "streamSid": "MZ123",
+            "media": {"payload": "AQID"},
+        }
+        assert mark == {"event": "mark", "streamSid": "MZ123", "mark": {"name": "1"}}
+
+    async def test_writer_coalesces_adjacent_audio(self, handler):
+        """Test that consecutive chunks of one content part share a frame."""
+        writer = asyncio.create_task(handler._twilio_audio_writer_loop())
+
+        for _ in range(3):
+            await handler._handle_realtime_event(audio_event("item-1", b"a" * 50))
+        await handler._handle_realtime_event(audio_event("item-2", b"b" * 50))
+        await handler.twilio_websocket.wait_for_audio(200)
+        writer.cancel()
+
+        frames = [f for f in handler.twilio_websocket.sent if f["event"] == "media"]
+        assert len(frames) == 2
+        assert len(handler._pending_marks) == 2
+
+    async def test_interruption_clears_twilio_playback(self, handler):
+        """Test that an interruption drops queued audio and sends a clear."""
+        await handler._handle_twilio_message(
+            {"event": "start", "start": {"streamSid": "MZ123", "customParameters": {}}}
+        )
+        await handler._handle_realtime_event(audio_event("item-1", b"a"))
+
+        await handler._handle_realtime_event(SimpleNamespace(type="audio_interrupted"))
+
+        assert handler._outbound_audio.empty()
+        assert handler.twilio_websocket.sent == [
+            {"event": "clear", "streamSid": "MZ123"}
+        ]
+
+    async def test_interruption_drops_audio_held_by_writer(self):
+        """Test that audio held back from a batch is not sent after a clear."""
+        websocket = GatedWebSocket()
+        handler = TwilioHandler(websocket)
+        writer = asyncio.create_task(handler._twilio_audio_writer_loop())
+
+        # A is being sent while B waits in the writer for the next batch
+        await handler._handle_realtime_event(audio_event("item-a", b"A"))
+        await handler._handle_realtime_event(audio_event("item-b", b"B"))
+        await asyncio.wait_for(websocket.media_blocked.wait(), timeout=1)
+
+        await handler._handle_realtime_event(SimpleNamespace(type="audio_interrupted"))
+        await handler._handle_realtime_event(audio_event("item-c", b"C"))
+        websocket.release.set()
+        await websocket.wait_for_audio(2)
+        writer.cancel()
+
+        assert websocket.media_audio() == [b"A", b"C"]
+
+    async def test_mark_reports_playback(self, handler):
+        """Test that a Twilio mark advances the playback tracker."""
+        await handler._send_audio_to_twilio("item-1", 0, b"a" * 160)
+
+        await handler._handle_twilio_message({"event": "mark", "mark": {"name": "1"}})
+
+        state = handler.playback_tracker.get_state()
+        assert state["current_item_id"] == "item-1"
+        assert state["elapsed_ms"] == 20.0  # 160 bytes of 8kHz µ-law
+        assert not handler._pending_marks
+
+    async def test_mark_discards_earlier_pending_marks(self, handler):
+        """Test that marks Twilio skipped over are dropped from the queue."""
+        for _ in range(3):
+            await handler._send_audio_to_twilio("item-1", 0, b"a" * 160)
+
+        await handler._handle_twilio_message({"event": "mark", "mark": {"name": "2"}})
+
+        assert [mark[0] for mark in handler._pending_marks] == [3]
+
+    async def test_audio_burst_is_not_dropped(self, handler):
+        """Test that a burst larger than the queue reaches Twilio in full."""
+        writer = asyncio.create_task(handler._twilio_audio_writer_loop())
+        burst = handler._outbound_audio.maxsize + 24
+
+        for _ in range(burst):
+            await handler._handle_realtime_event(audio_event("item-1", b"a" * 160))
+        await handler.twilio_websocket.wait_for_audio(burst * 160)
+        writer.cancel()
+
+        assert b"".join(handler.twilio_websocket.media_audio()) == b"a" * 160 * burst
+
+
+class TestInboundAudio:
+    """Test receiving Twilio audio for OpenAI."""
+
+    async def test_media_payload_is_buffered(self):
+        """Test that decoded µ-law bytes are buffered until flushed."""
+        handler = TwilioHandler(FakeWebSocket())
+
+        await handler._handle_twilio_message(
+            {"event": "media", "media": {"payload": "AQID"}}
+        )
+
+        assert handler._audio_chunks == [b"\x01\x02\x03"]
+        assert handler._audio_buffer_len == 3
+
+
+class TestMediaPayloadFastPath:
+    """Test extracting audio from raw Twilio media frames."""
+
+    def test_extracts_payload_from_media_frame(self):
+        """Test that the payload of a Twilio media frame is sliced out."""
+        frame = json.dumps(
+            {
+                "event": "media",
+                "sequenceNumber": "3",
+                "media": {"track": "inbound", "chunk": "1", "payload": "AQID"},
+                "streamSid": "MZ123",
+            },
+            separators=(",", ":"),
+        )
+
+        assert _media_payload(frame) == "AQID"
+
+    def test_other_events_are_not_fast_pathed(self):
+        """Test that non-media frames are left for the JSON parser."""
+        frame = '{"event":"mark","streamSid":"MZ123","mark":{"name":"1"}}'
+
+        assert _media_payload(frame) is None
+
+    def test_escaped_payload_falls_back_to_json(self):
+        """Test that JSON escapes in the payload are not passed through."""
+        frame = '{"event":"media","media":{"payload":"ab\\/cd"}}'
+
+        assert _media_payload(frame) is None
+
+
+class TestShutdown:
+    """Test handler teardown when the call ends."""
+
+    async def test_wait_until_done_stops_session_tasks(self):
+        """Test that background loops do not outlive the Twilio stream."""
+        handler = TwilioHandler(FakeWebSocket())
+        handler._message_loop_task = asyncio.create_task(asyncio.sleep(0))
+        background = asyncio.create_task(asyncio.sleep(60))
+        handler._session_tasks = [background]
+
+        await handler.wait_until_done()
+
+        assert background.cancelled()
+        assert handler._session_tasks == []